@@ -3,8 +3,15 @@ try:
     from deflate import gzip_decompress as gzip_inflate
 
 except ImportError:
-    from gzip import compress as gzip_deflate
+    import zlib
     from gzip import decompress as gzip_inflate
 
+    def gzip_deflate(data: bytes, compresslevel: int = 9) -> bytes:
+        # Equivalent to gzip.compress, but goes straight to zlib instead of
+        # through a GzipFile (which older Pythons do), and leaves the header
+        # timestamp as zero so output is reproducible
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
 
 __all__ = ["gzip_inflate", "gzip_deflate"]
@@ -1,10 +1,10 @@
+import copy
 import hashlib
 import io
 import os
 import struct
 import sys
 import tempfile
-import urllib.request
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -106,6 +106,14 @@ class CDF:
         self._compressed = not (compressed_bool == "0000ffff")
         self.compressed_file = None
         self.temp_file: Optional[Path] = None
+        # The file can't change once opened, so these are only read once
+        self._cdf_info_cache: Optional[CDFInfo] = None
+        self._globalatts_cache: Optional[Dict[str, List[Union[str, np.ndarray]]]] = None
+        self._zvariable_index: Optional[Tuple[Dict[str, int], List[int]]] = None
+        self._rvariable_index: Optional[Tuple[Dict[str, int], List[int]]] = None
+        self._attribute_index: Optional[Dict[str, List[int]]] = None
+        self._vdr_cache: Dict[int, VDR] = {}
+        self._adr_cache: Dict[int, ADRInfo] = {}
 
         if self._compressed:
             if self.ftype == "url" or self.ftype == "s3":
@@ -168,10 +176,25 @@ class CDF:
     def __del__(self) -> None:
         # This implicitly will delete a temporary uncompressed file if we
         # created it earlier.
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the open file handle to the CDF file, and removes the
+        temporary uncompressed file if one was created.
+        """
         if hasattr(self, "_f") and hasattr(self._f, "close"):
             self._f.close()
         if hasattr(self, "temp_file") and self.temp_file is not None:
             os.remove(self.temp_file)
+            self.temp_file = None
+        self._cdf_info_cache = None
+        self._globalatts_cache = None
+        self._zvariable_index = None
+        self._rvariable_index = None
+        self._attribute_index = None
+        self._vdr_cache = {}
+        self._adr_cache = {}
 
     def __getitem__(self, variable: str) -> Union[str, np.ndarray]:
         return self.varget(variable)
@@ -180,7 +203,7 @@ class CDF:
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        return
+        self.close()
 
     def cdf_info(self) -> CDFInfo:
         """
@@ -190,21 +213,23 @@ class CDF:
         -------
         CDFInfo
         """
-        varnames = self._get_varnames()
-        return CDFInfo(
-            self.file,
-            self._version,
-            self._encoding,
-            self._majority,
-            varnames[0],
-            varnames[1],
-            self._get_attnames(),
-            self._copyright,
-            self._md5,
-            self._num_rdim,
-            self._rdim_sizes,
-            self._compressed,
-        )
+        if self._cdf_info_cache is None:
+            varnames = self._get_varnames()
+            self._cdf_info_cache = CDFInfo(
+                self.file,
+                self._version,
+                self._encoding,
+                self._majority,
+                varnames[0],
+                varnames[1],
+                self._get_attnames(),
+                self._copyright,
+                self._md5,
+                self._num_rdim,
+                self._rdim_sizes,
+                self._compressed,
+            )
+        return copy.deepcopy(self._cdf_info_cache)
 
     def varinq(self, variable: str) -> VDRInfo:
         """
@@ -249,13 +274,10 @@ class CDF:
         """
         position = self._first_adr
         if isinstance(attribute, str):
-            for _ in range(0, self._num_att):
-                name, next_adr = self._read_adr_fast(position)
-                if name.strip().lower() == attribute.strip().lower():
-                    return self._read_adr(position)
-
-                position = next_adr
-            raise KeyError(f"No attribute {attribute}")
+            positions = self._get_attribute_index().get(attribute.strip().lower())
+            if not positions:
+                raise KeyError(f"No attribute {attribute}")
+            return copy.deepcopy(self._read_adr(positions[0]))
 
         elif isinstance(attribute, int):
             if attribute < 0 or attribute > self._num_zvariable:
@@ -264,7 +286,7 @@ class CDF:
                 name, next_adr = self._read_adr_fast(position)
                 position = next_adr
 
-            return self._read_adr(position)
+            return copy.deepcopy(self._read_adr(position))
         else:
             raise ValueError("attribute keyword must be a string or integer")
 
@@ -291,19 +313,14 @@ class CDF:
         # Get Correct ADR
         adr_info = None
         if isinstance(attribute, str):
-            for _ in range(0, self._num_att):
-                name, next_adr = self._read_adr_fast(position)
-                if name.strip().lower() == attribute.strip().lower():
-                    adr_info = self._read_adr(position)
-                    if isinstance(entry, str) and adr_info.scope == 1:
-                        # If the user has specified a string entry, they are obviously looking for a variable attribute.
-                        # Filter out any global attributes that may have the same name.
-                        adr_info = None
-                        position = next_adr
-                        continue
-                    break
-                else:
-                    position = next_adr
+            for position in self._get_attribute_index().get(attribute.strip().lower(), []):
+                adr_info = self._read_adr(position)
+                if isinstance(entry, str) and adr_info.scope == 1:
+                    # If the user has specified a string entry, they are obviously looking for a variable attribute.
+                    # Filter out any global attributes that may have the same name.
+                    adr_info = None
+                    continue
+                break
 
             if adr_info is None:
                 raise KeyError(f"No attribute {attribute} for entry {entry}")
@@ -333,24 +350,16 @@ class CDF:
             var_num = -1
             zvar = False
             if isinstance(entry, str):
-                # a zVariable?
-                positionx = self._first_zvariable
-                for x in range(0, self._num_zvariable):
-                    name, vdr_next = self._read_vdr_fast(positionx)
-                    if name.strip().lower() == entry.strip().lower():
-                        var_num = x
-                        zvar = True
-                        break
-                    positionx = vdr_next
-                if var_num == -1:
-                    # a rVariable?
-                    positionx = self._first_rvariable
-                    for x in range(0, self._num_rvariable):
-                        name, vdr_next = self._read_vdr_fast(positionx)
-                        if name.strip().lower() == entry.strip().lower():
-                            var_num = x
-                            break
-                        positionx = vdr_next
+                entry_name = entry.strip().lower()
+                znames, _ = self._get_variable_index(True)
+                rnames, _ = self._get_variable_index(False)
+                if entry_name in znames:
+                    # a zVariable
+                    var_num = znames[entry_name]
+                    zvar = True
+                elif entry_name in rnames:
+                    # a rVariable
+                    var_num = rnames[entry_name]
                 if var_num == -1:
                     raise ValueError(f"No variable by this name: {entry}")
                 entry_num = var_num
@@ -450,39 +459,30 @@ class CDF:
 
         if isinstance(variable, str):
             # Check z variables for the name, then r variables
-            position = self._first_zvariable
-            num_variables = self._num_zvariable
+            name = variable.strip().lower()
             vdr_info = None
-            for zVar in [1, 0]:
-                for _ in range(0, num_variables):
-                    name, vdr_next = self._read_vdr_fast(position)
-                    if name.strip().lower() == variable.strip().lower():
-                        vdr_info = self._read_vdr(position)
-                        break
-                    position = vdr_next
-                position = self._first_rvariable
-                num_variables = self._num_rvariable
+            for zVar in [True, False]:
+                names, positions = self._get_variable_index(zVar)
+                if name in names:
+                    vdr_info = self._read_vdr(positions[names[name]])
             if vdr_info is None:
                 raise ValueError(f"Variable name '{variable}' not found.")
         elif isinstance(variable, int):
             if self._num_zvariable > 0:
-                position = self._first_zvariable
                 num_variable = self._num_zvariable
-                # zVar = True
+                zVar = True
             elif self._num_rvariable > 0:
-                position = self._first_rvariable
                 num_variable = self._num_rvariable
-                # zVar = False
+                zVar = False
             if variable < 0 or variable >= num_variable:
                 raise ValueError(f"No variable by this number: {variable}")
-            for _ in range(0, variable):
-                name, next_vdr = self._read_vdr_fast(position)
-                position = next_vdr
-            vdr_info = self._read_vdr(position)
+            _, positions = self._get_variable_index(zVar)
+            vdr_info = self._read_vdr(positions[variable])
         else:
             raise ValueError("Please set variable keyword equal to " "the name or number of an variable")
 
-        return vdr_info
+        # Records are cached, so hand out a copy the caller is free to modify
+        return copy.deepcopy(vdr_info)
 
     def globalattsget(self) -> Dict[str, List[Union[str, np.ndarray]]]:
         """
@@ -492,6 +492,9 @@ class CDF:
         in a dictionary (in the form of ``'attribute': {entry: value}``
         pairs) from a CDF.
         """
+        if self._globalatts_cache is not None:
+            return copy.deepcopy(self._globalatts_cache)
+
         byte_loc = self._first_adr
         return_dict: Dict[str, List[Union[str, np.ndarray]]] = {}
         for _ in range(self._num_att):
@@ -518,7 +521,8 @@ class CDF:
             return_dict[adr_info.name] = entries
             byte_loc = adr_info.next_adr_loc
 
-        return return_dict
+        self._globalatts_cache = return_dict
+        return copy.deepcopy(return_dict)
 
     def varattsget(self, variable: Union[str, int]) -> Dict[str, Union[None, str, np.ndarray]]:
         """
@@ -532,17 +536,12 @@ class CDF:
         if isinstance(variable, int) and self._num_zvariable > 0 and self._num_rvariable > 0:
             raise ValueError("This CDF has both r and z variables. Use variable name")
         if isinstance(variable, str):
-            position = self._first_zvariable
-            num_variables = self._num_zvariable
+            name = variable.strip().lower()
             for zVar in [True, False]:
-                for _ in range(0, num_variables):
-                    name, vdr_next = self._read_vdr_fast(position)
-                    if name.strip().lower() == variable.strip().lower():
-                        vdr_info = self._read_vdr(position)
-                        return self._read_varatts(vdr_info.variable_number, zVar)
-                    position = vdr_next
-                position = self._first_rvariable
-                num_variables = self._num_rvariable
+                names, positions = self._get_variable_index(zVar)
+                if name in names:
+                    vdr_info = self._read_vdr(positions[names[name]])
+                    return self._read_varatts(vdr_info.variable_number, zVar)
             raise ValueError(f"No variable by this name: {variable}")
         elif isinstance(variable, int):
             if self._num_zvariable > 0:
@@ -769,6 +768,48 @@ class CDF:
             position = adr_info.next_adr_loc
         return attrs
 
+    def _get_variable_index(self, zVar: bool) -> Tuple[Dict[str, int], List[int]]:
+        """
+        Returns a map from (lower case) variable name to variable number,
+        and the VDR offset of each variable number, for either the z or r
+        variables. These are read once and then cached.
+        """
+        index = self._zvariable_index if zVar else self._rvariable_index
+        if index is None:
+            if zVar:
+                position = self._first_zvariable
+                num_variable = self._num_zvariable
+            else:
+                position = self._first_rvariable
+                num_variable = self._num_rvariable
+            names: Dict[str, int] = {}
+            positions: List[int] = []
+            for num in range(0, num_variable):
+                name, next_vdr = self._read_vdr_fast(position)
+                names.setdefault(name.strip().lower(), num)
+                positions.append(position)
+                position = next_vdr
+            index = (names, positions)
+            if zVar:
+                self._zvariable_index = index
+            else:
+                self._rvariable_index = index
+        return index
+
+    def _get_attribute_index(self) -> Dict[str, List[int]]:
+        """
+        Returns a map from (lower case) attribute name to the offsets of the
+        ADRs with that name, in file order. This is read once and then cached.
+        """
+        if self._attribute_index is None:
+            self._attribute_index = {}
+            position = self._first_adr
+            for _ in range(0, self._num_att):
+                name, next_adr = self._read_adr_fast(position)
+                self._attribute_index.setdefault(name.strip().lower(), []).append(position)
+                position = next_adr
+        return self._attribute_index
+
     def _read_cdr(self, byte_loc: int) -> Tuple[CDRInfo, int]:
         """
         Read a CDF descriptor record (CDR).
@@ -951,10 +992,12 @@ class CDF:
         """
         Read an attribute descriptor record (ADR).
         """
-        if self.cdfversion == 3:
-            return self._read_adr3(position)
-        else:
-            return self._read_adr2(position)
+        if position not in self._adr_cache:
+            if self.cdfversion == 3:
+                self._adr_cache[position] = self._read_adr3(position)
+            else:
+                self._adr_cache[position] = self._read_adr2(position)
+        return self._adr_cache[position]
 
     def _read_adr3(self, byte_loc: int) -> ADRInfo:
         self._f.seek(byte_loc, 0)
@@ -1140,10 +1183,12 @@ class CDF:
         """
         Read a variable descriptor record (VDR).
         """
-        if self.cdfversion == 3:
-            return self._read_vdr3(byte_loc)
-        else:
-            return self._read_vdr2(byte_loc)
+        if byte_loc not in self._vdr_cache:
+            if self.cdfversion == 3:
+                self._vdr_cache[byte_loc] = self._read_vdr3(byte_loc)
+            else:
+                self._vdr_cache[byte_loc] = self._read_vdr2(byte_loc)
+        return self._vdr_cache[byte_loc]
 
     def _read_vdr3(self, byte_loc: int) -> VDR:
         self._f.seek(byte_loc, 0)
@@ -1496,38 +1541,56 @@ class CDF:
                     vdr.data_type,
                     vdr.num_elements,
                 )
-            cur_block = -1
             rec_size = numBytes * numValues
-            for rec_num in range(startrec, (endrec + 1)):
-                block, prev_block = self._find_block(vvr_start, vvr_end, cur_block, rec_num)
-                if block > -1:
-                    record_off = rec_num - vvr_start[block]
-                    if cur_block != block:
-                        if self.cdfversion == 3:
-                            var_block_data = self._read_vvr_block(vvr_offs[block])
-                        else:
-                            var_block_data = self._read_vvr_block2(vvr_offs[block])
-                        cur_block = block
-                    xoff = record_off * rec_size
-                    byte_stream[pos : pos + rec_size] = var_block_data[xoff : xoff + rec_size]
-                else:
-                    if vdr.sparse == 1:
-                        # use defined pad or default pad
-                        byte_stream[pos : pos + rec_size] = filled_data * numValues
+            records = np.frombuffer(byte_stream, dtype=np.uint8).reshape(totalRecs, rec_size)
+            pad_record = np.frombuffer(filled_data[:numBytes] * numValues, dtype=np.uint8)
+            prev_block = -1
+
+            def fill_virtual(first: int, last: int) -> None:
+                # Fill the virtual records [first, last) of the output with one
+                # slice assignment, using the defined/default pad or, for
+                # "previous" sparseness, the record just before the gap
+                if first >= last:
+                    return
+                if vdr.sparse == 1:
+                    records[first:last] = pad_record
+                elif first > 0:
+                    records[first:last] = records[first - 1]
+                elif prev_block != -1:
+                    # The range starts in a gap, so take the last record of
+                    # the block before it
+                    if self.cdfversion == 3:
+                        var_prev_block_data = self._read_vvr_block(vvr_offs[prev_block])
                     else:
-                        # use previous physical record
-                        if prev_block != -1:
-                            if self.cdfversion == 3:
-                                var_prev_block_data = self._read_vvr_block(vvr_offs[prev_block])
-                            else:
-                                var_prev_block_data = self._read_vvr_block2(vvr_offs[prev_block])
-                            lastRecOff = (vvr_end[prev_block] - vvr_start[prev_block]) * rec_size
-                            byte_stream[pos : pos + rec_size] = var_prev_block_data[lastRecOff:]
-                        else:
-                            byte_stream[pos : pos + rec_size] = filled_data * numValues
-                pos = pos + rec_size
-                if block > -1:
-                    cur_block = block
+                        var_prev_block_data = self._read_vvr_block2(vvr_offs[prev_block])
+                    lastRecOff = (vvr_end[prev_block] - vvr_start[prev_block]) * rec_size
+                    records[first:last] = np.frombuffer(var_prev_block_data[lastRecOff:], dtype=np.uint8)
+                else:
+                    records[first:last] = pad_record
+
+            # Copy in the physical records block by block, filling the gaps
+            # between them as we go, so each output record is written once
+            filled = 0
+            for vvr_num in range(0, len(vvr_offs)):
+                if vvr_end[vvr_num] < startrec:
+                    prev_block = vvr_num
+                    continue
+                if vvr_start[vvr_num] > endrec:
+                    break
+                if self.cdfversion == 3:
+                    var_block_data = self._read_vvr_block(vvr_offs[vvr_num])
+                else:
+                    var_block_data = self._read_vvr_block2(vvr_offs[vvr_num])
+                first = max(vvr_start[vvr_num], startrec)
+                last = min(vvr_end[vvr_num], endrec)
+                fill_virtual(filled, first - startrec)
+                xoff = (first - vvr_start[vvr_num]) * rec_size
+                nbytes = (last - first + 1) * rec_size
+                pos = (first - startrec) * rec_size
+                byte_stream[pos : pos + nbytes] = var_block_data[xoff : xoff + nbytes]
+                filled = last - startrec + 1
+            fill_virtual(filled, totalRecs)
+            del records
         dimensions = []
         var_vary = vdr.dim_vary
         var_sizes = vdr.dim_sizes
@@ -1731,6 +1794,10 @@ class CDF:
                 dt_string += "c16"
             dt = np.dtype(dt_string)
             ret = np.frombuffer(byte_stream, dtype=dt, count=num_recs * num_elems)
+            # Put the data into system byte order.  The dtype above carries the
+            # byte order of the CDF, so this is a single byteswapping copy (or
+            # nothing at all if the CDF already matches the system).
+            ret = ret.astype(ret.dtype.newbyteorder("="), copy=False)
             try:
                 ret.setflags(write=True)
             except ValueError:
@@ -1742,10 +1809,6 @@ class CDF:
             if dimensions is not None:
                 dimensions.pop()
 
-        # Put the data into system byte order
-        if self._convert_option() != "=":
-            ret = ret.view(ret.dtype.newbyteorder()).byteswap()
-
         if self._majority == "Column_major":
             if dimensions is not None:
                 axes = [0] + list(range(len(dimensions), 0, -1))
@@ -2018,29 +2081,14 @@ class CDF:
         else:
             raise RuntimeError("Unexpected section type")
 
-    @staticmethod
-    def _find_block(starts: List[int], ends: List[int], cur_block: int, rec_num: int) -> Tuple[int, int]:
-        """
-        Finds the block that rec_num is in if it is found. Otherwise it returns -1.
-        It also returns the block that has the physical data either at or
-        preceeding the rec_num.
-        It could be -1 if the preceeding block does not exists.
-        """
-        total = len(starts)
-        if cur_block == -1:
-            cur_block = 0
-        for x in range(cur_block, total):
-            if starts[x] <= rec_num and ends[x] >= rec_num:
-                return x, x
-            if starts[x] > rec_num:
-                break
-        return -1, x - 1
-
     def _file_or_url_or_s3_handler(
         self, filename: str, filetype: str, s3_read_method: int
     ) -> Union["S3object", io.BufferedReader, io.BytesIO]:
         bdata: Union["S3object", io.BufferedReader, io.BytesIO]
         if filetype == "url":
+            # Only needed for remote files, and slow to import
+            import urllib.request
+
             req = urllib.request.Request(filename)
             response = urllib.request.urlopen(req)
             bdata = io.BytesIO(response.read())
@@ -4,14 +4,31 @@ import io
 import logging
 import math
 import numbers
+import os
 import pathlib
 import platform as pf
 import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from itertools import repeat
 from numbers import Number
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import numpy as np
 import numpy.typing as npt
@@ -22,16 +39,42 @@ from cdflib.logging import logger
 
 __all__ = ["CDF"]
 
+# Fixed part of an AEDR: RecordSize, RecordType, AEDRnext, AttrNum,
+# DataType, Num, NumElems, NumStrings and the four rfu fields
+_AEDR_HEADER = struct.Struct(">qiqiiiiiiiii")
 
-def is_open(func):
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def is_open(func: F) -> F:
     @wraps(func)
-    def ensure_open(self, *args, **kwargs):
+    def ensure_open(self: "CDF", *args: Any, **kwargs: Any) -> Any:
         if self.is_closed:
             raise OSError("This file is already closed, and can no longer be modified.")
         else:
             return func(self, *args, **kwargs)
 
-    return ensure_open
+    return cast(F, ensure_open)
+
+
+class _HashingWriter:
+    """
+    Wraps a file so that every byte written through it also goes into a
+    running MD5, which saves reading the file back to checksum it. Only
+    valid for files written front to back, with nothing patched in place.
+    """
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self.md5 = hashlib.md5()
+
+    def write(self, data: bytes) -> int:
+        self.md5.update(data)
+        return self._f.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._f, name)
 
 
 class CDF:
@@ -175,6 +218,11 @@ class CDF:
     # BLOCKING_BYTES = 131072
     BLOCKING_BYTES = 65536
 
+    # Buffer size for the open file. Writing a record means many small
+    # seeks, reads and writes to update links, so a large buffer saves a
+    # lot of system calls.
+    FILE_BUFFER_SIZE = 1048576
+
     level = 0
 
     def __init__(self, path: Union[str, Path], cdf_spec: Optional[Dict[str, Any]] = None, delete: bool = False):
@@ -241,8 +289,8 @@ class CDF:
         self.compressed_file = path.with_suffix(".tmp") if cdf_compression > 0 else None
 
         # Dictionary objects, these contains name, offset, and dimension information
-        self.zvarsinfo: Dict[int, Tuple[str, int, int, List[int], List[bool]]] = {}
-        self.rvarsinfo: Dict[int, Tuple[str, int, int, List[int], List[bool]]] = {}
+        self.zvarsinfo: Dict[int, Tuple[str, int, int, Sequence[int], Sequence[bool]]] = {}
+        self.rvarsinfo: Dict[int, Tuple[str, int, int, Sequence[int], Sequence[bool]]] = {}
 
         # Dictionary object, contains name, offset, and scope (global or variable)
         self.attrsinfo: Dict[int, Tuple[str, int, int]] = {}
@@ -258,7 +306,7 @@ class CDF:
         self.rdim_sizes = rdim_sizes  # Size of r dimensions
         self.majority = major
 
-        with path.open("wb") as f:
+        with path.open("wb", buffering=self.FILE_BUFFER_SIZE) as f:
             f.write(binascii.unhexlify(self.V3magicNUMBER_1))
             f.write(binascii.unhexlify(self.V3magicNUMBER_2))
 
@@ -289,7 +337,7 @@ class CDF:
             return
 
         if self.compressed_file is None:
-            with self.path.open("rb+") as f:
+            with self.path.open("rb+", buffering=self.FILE_BUFFER_SIZE) as f:
                 f.seek(0, 2)
                 eof = f.tell()
                 self._update_offset_value(f, self.gdr_head + 36, 8, eof)
@@ -298,26 +346,28 @@ class CDF:
                 self.is_closed = True
             return
 
-        with self.path.open("rb+") as f:
+        with self.path.open("rb+", buffering=self.FILE_BUFFER_SIZE) as f:
             f.seek(0, 2)
             eof = f.tell()
             self._update_offset_value(f, self.gdr_head + 36, 8, eof)
 
-            with self.compressed_file.open("wb+") as g:
-                g.write(bytearray.fromhex(self.V3magicNUMBER_1))
-                g.write(bytearray.fromhex(self.V3magicNUMBER_2c))
-                self._write_ccr(f, g, self.compression)
+            with self.compressed_file.open("wb+", buffering=self.FILE_BUFFER_SIZE) as g:
+                # The compressed file is written strictly in order, so its
+                # checksum can be worked out as it is written
+                out: Union[BinaryIO, _HashingWriter] = _HashingWriter(g) if self.checksum else g
+                out.write(bytearray.fromhex(self.V3magicNUMBER_1))
+                out.write(bytearray.fromhex(self.V3magicNUMBER_2c))
+                self._write_ccr(f, out, self.compression)
 
-                if self.checksum:
-                    g.seek(0, 2)
-                    g.write(self._md5_compute(g))
+                if isinstance(out, _HashingWriter):
+                    g.write(out.md5.digest())
 
         self.path.unlink()  # NOTE: for Windows this is necessary
         self.compressed_file.rename(self.path)
         self.is_closed = True
 
     @is_open
-    def write_globalattrs(self, globalAttrs):
+    def write_globalattrs(self, globalAttrs: Dict[str, Any]) -> None:
         """
         Writes the global attributes.
 
@@ -365,7 +415,7 @@ class CDF:
             raise ValueError("Global attribute(s) not in dictionary form")
         dataType = None
         numElems = None
-        with self.path.open("rb+") as f:
+        with self.path.open("rb+", buffering=self.FILE_BUFFER_SIZE) as f:
             f.seek(0, 2)  # EOF (appending)
             for attr, entry in globalAttrs.items():
                 if attr in self.gattrs:
@@ -450,7 +500,7 @@ class CDF:
                 self._update_offset_value(f, offsetADR + 40, 4, entryNumMaX)
 
     @is_open
-    def write_variableattrs(self, variableAttrs):
+    def write_variableattrs(self, variableAttrs: Dict[str, Any]) -> None:
         """
         Writes a variable's attributes, provided the variable already exists.
 
@@ -482,7 +532,7 @@ class CDF:
             raise ValueError("Variable attribute(s) not in dictionary form")
         dataType = None
         numElems = None
-        with self.path.open("rb+") as f:
+        with self.path.open("rb+", buffering=self.FILE_BUFFER_SIZE) as f:
             f.seek(0, 2)  # EOF (appending)
             for attr, attrs in variableAttrs.items():
                 if not (isinstance(attr, str)):
@@ -611,7 +661,7 @@ class CDF:
                     self._update_offset_value(f, offsetA + 40, 4, entryNumX)
 
     @is_open
-    def write_var(self, var_spec, var_attrs=None, var_data=None):
+    def write_var(self, var_spec: Dict[str, Any], var_attrs: Optional[Dict[str, Any]] = None, var_data: Any = None) -> None:
         """
         Writes a variable, along with variable attributes and data.
 
@@ -703,6 +753,29 @@ class CDF:
 
             See the sample for its setup.
 
+        """
+        self.write_vars([(var_spec, var_attrs, var_data)])
+
+    @is_open
+    def write_vars(self, variables: Iterable[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Any]]) -> None:
+        """
+        Writes several variables one after another, in the same way as
+        calling write_var for each of them, but only opening the file once.
+
+        Parameters
+        ----------
+        variables : list of tuples
+            A (var_spec, var_attrs, var_data) tuple for each variable,
+            holding the arguments that would be passed to write_var.
+            var_attrs and var_data can be None.
+        """
+        with self.path.open("rb+", buffering=self.FILE_BUFFER_SIZE) as f:
+            for var_spec, var_attrs, var_data in variables:
+                self._write_var(f, var_spec, var_attrs, var_data)
+
+    def _write_var(self, f: BinaryIO, var_spec: Dict[str, Any], var_attrs: Optional[Dict[str, Any]], var_data: Any) -> None:
+        """
+        Writes a variable to the open file "f". See write_var.
         """
         if not isinstance(var_spec, dict):
             raise TypeError("Variable should be in dictionary form.")
@@ -731,20 +804,20 @@ class CDF:
                 raise ValueError("Invalid Num_Elements for numeric data type variable")
         # If its a z variable, get the dimension info
         # Otherwise, use r variable info
+        # (copied into tuples, so the variable info kept for this variable
+        # doesn't change if the caller goes on to reuse their var_spec)
         if zVar:
             try:
-                dimSizes = var_spec["Dim_Sizes"]
+                dimSizes = tuple(var_spec["Dim_Sizes"])
                 numDims = len(dimSizes)
-                dimVary = []
-                for _ in range(0, numDims):
-                    dimVary.append(True)
+                dimVary = (True,) * numDims
             except Exception:
                 raise ValueError("Missing/invalid required spec for creating variable.")
         else:
-            dimSizes = self.rdim_sizes
+            dimSizes = tuple(self.rdim_sizes or ())
             numDims = self.num_rdim
             try:
-                dimVary = var_spec["Dim_Vary"]
+                dimVary = tuple(var_spec["Dim_Vary"])
                 if len(dimVary) != numDims:
                     raise ValueError("Invalid Dim_Vary size for the rVariable.")
             except Exception:
@@ -770,59 +843,58 @@ class CDF:
         if name in self.zvars or name in self.rvars:
             raise ValueError(f"{name} already exists")
 
-        with self.path.open("rb+") as f:
-            f.seek(0, 2)  # EOF (appending)
-            varNum, offset = self._write_vdr(
-                f, dataType, numElems, numDims, dimSizes, name, dimVary, recVary, sparse, blockingfactor, compression, pad, zVar
-            )
-            # Update the GDR pointers if needed
-            if zVar:
-                if len(self.zvars) == 1:
-                    # GDR's zVDRhead
-                    self._update_offset_value(f, self.gdr_head + 20, 8, offset)
+        f.seek(0, 2)  # EOF (appending)
+        varNum, offset = self._write_vdr(
+            f, dataType, numElems, numDims, dimSizes, name, dimVary, recVary, sparse, blockingfactor, compression, pad, zVar
+        )
+        # Update the GDR pointers if needed
+        if zVar:
+            if len(self.zvars) == 1:
+                # GDR's zVDRhead
+                self._update_offset_value(f, self.gdr_head + 20, 8, offset)
+        else:
+            if len(self.rvars) == 1:
+                # GDR's rVDRhead
+                self._update_offset_value(f, self.gdr_head + 12, 8, offset)
+
+        # Write the variable attributes
+        if var_attrs is not None:
+            self._write_var_attrs(f, varNum, var_attrs, zVar)
+
+        # Write the actual data to the file
+        if not (var_data is None):
+            if sparse == 0:
+                varMaxRec = self._write_var_data_nonsparse(
+                    f, zVar, varNum, dataType, numElems, recVary, compression, blockingfactor, var_data
+                )
             else:
-                if len(self.rvars) == 1:
-                    # GDR's rVDRhead
-                    self._update_offset_value(f, self.gdr_head + 12, 8, offset)
-
-            # Write the variable attributes
-            if var_attrs is not None:
-                self._write_var_attrs(f, varNum, var_attrs, zVar)
-
-            # Write the actual data to the file
-            if not (var_data is None):
-                if sparse == 0:
-                    varMaxRec = self._write_var_data_nonsparse(
-                        f, zVar, varNum, dataType, numElems, recVary, compression, blockingfactor, var_data
+                notsupport = False
+                if not isinstance(var_data, (list, tuple)):
+                    notsupport = True
+
+                if notsupport or len(var_data) != 2:
+                    logger.warning(
+                        "Sparse record #s and data are not of list/tuple form:\n"
+                        " [ [rec_#1, rec_#2, rec_#3,    ],\n"
+                        "   [data_#1, data_#2, data_#3, ....] ]"
                     )
-                else:
-                    notsupport = False
-                    if not isinstance(var_data, (list, tuple)):
-                        notsupport = True
-
-                    if notsupport or len(var_data) != 2:
-                        logger.warning(
-                            "Sparse record #s and data are not of list/tuple form:\n"
-                            " [ [rec_#1, rec_#2, rec_#3,    ],\n"
-                            "   [data_#1, data_#2, data_#3, ....] ]"
-                        )
-                        return
+                    return
 
-                    # Format data into: [[recstart1, recend1, data1],
-                    #                   [recstart2,recend2,data2], ...]
-                    var_data = self._make_sparse_blocks(var_spec, var_data[0], var_data[1])
+                # Format data into: [[recstart1, recend1, data1],
+                #                   [recstart2,recend2,data2], ...]
+                var_data = self._make_sparse_blocks(var_spec, var_data[0], var_data[1])
 
-                    for block in var_data:
-                        varMaxRec = self._write_var_data_sparse(f, zVar, varNum, dataType, numElems, recVary, block)
-                # Update GDR MaxRec if writing an r variable
-                if not zVar:
-                    # GDR's rMaxRec
-                    f.seek(self.gdr_head + 52)
-                    maxRec = int.from_bytes(f.read(4), "big", signed=True)
-                    if maxRec < varMaxRec:
-                        self._update_offset_value(f, self.gdr_head + 52, 4, varMaxRec)
+                for block in var_data:
+                    varMaxRec = self._write_var_data_sparse(f, zVar, varNum, dataType, numElems, recVary, block)
+            # Update GDR MaxRec if writing an r variable
+            if not zVar:
+                # GDR's rMaxRec
+                f.seek(self.gdr_head + 52)
+                maxRec = int.from_bytes(f.read(4), "big", signed=True)
+                if maxRec < varMaxRec:
+                    self._update_offset_value(f, self.gdr_head + 52, 4, varMaxRec)
 
-    def _write_var_attrs(self, f: io.BufferedWriter, varNum: int, var_attrs: Dict[str, Any], zVar: bool) -> None:
+    def _write_var_attrs(self, f: BinaryIO, varNum: int, var_attrs: Dict[str, Any], zVar: bool) -> None:
         """
         Writes ADRs and AEDRs for variables
 
@@ -944,7 +1016,7 @@ class CDF:
 
     def _write_var_data_nonsparse(
         self,
-        f: io.BufferedWriter,
+        f: BinaryIO,
         zVar: bool,
         var: int,
         dataType: int,
@@ -1047,7 +1119,11 @@ class CDF:
             nEntries = self.NUM_VXR_ENTRIES
             VXRhead = None
 
-            # Loop through blocks, create VVRs/CVVRs
+            # Split the data into blocks. Slicing through a memoryview
+            # doesn't copy, so no block is duplicated before compression.
+            mdata = memoryview(data)
+            recranges = []
+            bdatas = []
             for x in range(0, blocks):
                 startrec = x * blockingfactor
                 startloc = startrec * numValues * dataTypeSize
@@ -1058,8 +1134,12 @@ class CDF:
                 if endloc > len(data):
                     endrec = recs - 1
                     endloc = len(data)
-                bdata = data[startloc:endloc]
-                cdata = gzip_deflate(bdata, compression)
+                recranges.append((startrec, endrec))
+                bdatas.append(mdata[startloc:endloc])
+            cdatas = self._compress_blocks(bdatas, compression)
+
+            # Loop through blocks, create VVRs/CVVRs
+            for x, ((startrec, endrec), bdata, cdata) in enumerate(zip(recranges, bdatas, cdatas)):
                 if len(cdata) < len(bdata):
                     n1offset = self._write_cvvr(f, cdata)
                 else:
@@ -1106,7 +1186,7 @@ class CDF:
 
     def _write_var_data_sparse(
         self,
-        f: io.BufferedWriter,
+        f: BinaryIO,
         zVar: bool,
         var: int,
         dataType: int,
@@ -1193,7 +1273,7 @@ class CDF:
 
         return rec_end
 
-    def _create_vxr(self, f: io.BufferedWriter, recStart: int, recEnd: int, currentVDR: int, priorVXR: int, vvrOffset: int) -> int:
+    def _create_vxr(self, f: BinaryIO, recStart: int, recEnd: int, currentVDR: int, priorVXR: int, vvrOffset: int) -> int:
         """
         Create a VXR AND use a VXR
 
@@ -1229,7 +1309,7 @@ class CDF:
         self._update_offset_value(f, currentVDR + 36, 8, vxroffset)
         return vxroffset
 
-    def _use_vxrentry(self, f: io.BufferedWriter, VXRoffset: int, recStart: int, recEnd: int, offset: int) -> int:
+    def _use_vxrentry(self, f: BinaryIO, VXRoffset: int, recStart: int, recEnd: int, offset: int) -> int:
         """
         Adds a VVR pointer to a VXR
         """
@@ -1250,7 +1330,7 @@ class CDF:
         self._update_offset_value(f, VXRoffset + 24, 4, usedEntries)
         return usedEntries
 
-    def _add_vxr_levels_r(self, f: io.BufferedWriter, vxrhead: int, numVXRs: int) -> Tuple[int, int]:
+    def _add_vxr_levels_r(self, f: BinaryIO, vxrhead: int, numVXRs: int) -> Tuple[int, int]:
         """
         Build a new level of VXRs... make VXRs more tree-like
 
@@ -1321,7 +1401,7 @@ class CDF:
         else:
             return newvxrhead, newvxroff
 
-    def _update_vdr_vxrheadtail(self, f: io.BufferedWriter, vdr_offset: int, VXRoffset: int) -> None:
+    def _update_vdr_vxrheadtail(self, f: BinaryIO, vdr_offset: int, VXRoffset: int) -> None:
         """
         This sets a VXR to be the first and last VXR in the VDR
         """
@@ -1330,7 +1410,7 @@ class CDF:
         # VDR's VXRtail
         self._update_offset_value(f, vdr_offset + 36, 8, VXRoffset)
 
-    def _get_recrange(self, f: io.BufferedWriter, VXRoffset: int) -> Tuple[int, int]:
+    def _get_recrange(self, f: BinaryIO, VXRoffset: int) -> Tuple[int, int]:
         """
         Finds the first and last record numbers pointed by the VXR
         Assumes the VXRs are in order
@@ -1505,7 +1585,7 @@ class CDF:
         except Exception:
             return 0
 
-    def _write_cdr(self, f: io.BufferedWriter, major: int, encoding: int, checksum: int) -> int:
+    def _write_cdr(self, f: BinaryIO, major: int, encoding: int, checksum: int) -> int:
         f.seek(0, 2)
         byte_loc = f.tell()
         block_size = self.CDR_BASE_SIZE64 + self.CDF_COPYRIGHT_LEN
@@ -1552,7 +1632,7 @@ class CDF:
 
         return byte_loc
 
-    def _write_gdr(self, f: io.BufferedWriter) -> int:
+    def _write_gdr(self, f: BinaryIO) -> int:
         f.seek(0, 2)
         byte_loc = f.tell()
         block_size = self.GDR_BASE_SIZE64 + 4 * self.num_rdim
@@ -1594,7 +1674,7 @@ class CDF:
 
         return byte_loc
 
-    def _write_adr(self, f: io.BufferedWriter, gORv: bool, name: str) -> Tuple[int, int]:
+    def _write_adr(self, f: BinaryIO, gORv: bool, name: str) -> Tuple[int, int]:
         """
         Writes and ADR to the end of the file.
 
@@ -1676,7 +1756,7 @@ class CDF:
 
     def _write_aedr(
         self,
-        f: io.BufferedWriter,
+        f: BinaryIO,
         gORz: bool,
         attrNum: int,
         entryNum: int,
@@ -1771,18 +1851,22 @@ class CDF:
             value_size = recs * self._datatype_size(dataType, numElems)
         block_size = value_size + 56
         aedr = bytearray(block_size)
-        aedr[0:8] = struct.pack(">q", block_size)
-        aedr[8:12] = struct.pack(">i", section_type)
-        aedr[12:20] = struct.pack(">q", nextAEDR)
-        aedr[20:24] = struct.pack(">i", attrNum)
-        aedr[24:28] = struct.pack(">i", dataType)
-        aedr[28:32] = struct.pack(">i", entryNum)
-        aedr[32:36] = struct.pack(">i", numElems)
-        aedr[36:40] = struct.pack(">i", numStrings)
-        aedr[40:44] = struct.pack(">i", rfuB)
-        aedr[44:48] = struct.pack(">i", rfuC)
-        aedr[48:52] = struct.pack(">i", rfuD)
-        aedr[52:56] = struct.pack(">i", rfuE)
+        _AEDR_HEADER.pack_into(
+            aedr,
+            0,
+            block_size,
+            section_type,
+            nextAEDR,
+            attrNum,
+            dataType,
+            entryNum,
+            numElems,
+            numStrings,
+            rfuB,
+            rfuC,
+            rfuD,
+            rfuE,
+        )
         aedr[56:block_size] = cdata
         f.write(aedr)
 
@@ -1790,13 +1874,13 @@ class CDF:
 
     def _write_vdr(
         self,
-        f: io.BufferedWriter,
+        f: BinaryIO,
         cdataType: int,
         numElems: int,
         numDims: int,
-        dimSizes: List[int],
+        dimSizes: Sequence[int],
         name: str,
-        dimVary: List[bool],
+        dimVary: Sequence[bool],
         recVary: bool,
         sparse: int,
         blockingfactor: int,
@@ -1977,7 +2061,7 @@ class CDF:
 
         return num, byte_loc
 
-    def _write_vxr(self, f: io.BufferedWriter, numEntries: Optional[int] = None) -> int:
+    def _write_vxr(self, f: BinaryIO, numEntries: Optional[int] = None) -> int:
         """
         Creates a VXR at the end of the file.
         Returns byte location of the VXR
@@ -2012,7 +2096,7 @@ class CDF:
         f.write(vxr)
         return byte_loc
 
-    def _write_vvr(self, f: io.BufferedWriter, data: bytes) -> int:
+    def _write_vvr(self, f: BinaryIO, data: bytes) -> int:
         """
         Writes a vvr to the end of file "f" with the byte stream "data".
         """
@@ -2029,7 +2113,7 @@ class CDF:
 
         return byte_loc
 
-    def _write_cpr(self, f: io.BufferedWriter, cType: int, parameter: int) -> int:
+    def _write_cpr(self, f: Union[BinaryIO, _HashingWriter], cType: int, parameter: int) -> int:
         """
         Write compression info to the end of the file in a CPR.
         """
@@ -2051,7 +2135,7 @@ class CDF:
 
         return byte_loc
 
-    def _write_cvvr(self, f: io.BufferedWriter, data: Any) -> int:
+    def _write_cvvr(self, f: BinaryIO, data: Any) -> int:
         """
         Write compressed "data" variable to the end of the file in a CVVR
         """
@@ -2072,7 +2156,22 @@ class CDF:
 
         return byte_loc
 
-    def _write_ccr(self, f: io.BufferedWriter, g: io.BufferedWriter, level: int) -> None:
+    @staticmethod
+    def _compress_blocks(blocks: List[memoryview], level: int) -> List[bytes]:
+        """
+        Gzip compresses each block of variable data, returning the
+        compressed blocks in the same order.
+
+        The blocks are independent of each other, so when there is more
+        than one they are compressed on a pool of threads (the compressor
+        releases the GIL while it works).
+        """
+        if len(blocks) < 2:
+            return [gzip_deflate(block, level) for block in blocks]
+        with ThreadPoolExecutor(max_workers=min(len(blocks), os.cpu_count() or 1)) as pool:
+            return list(pool.map(gzip_deflate, blocks, repeat(level)))
+
+    def _write_ccr(self, f: BinaryIO, g: Union[BinaryIO, _HashingWriter], level: int) -> None:
         """
         Write a CCR to file "g" from file "f" with level "level".
         Currently, only handles gzip compression.
@@ -2095,7 +2194,9 @@ class CDF:
         rfuA = 0
         cData = gzip_deflate(data, level)
         block_size = self.CCR_BASE_SIZE64 + len(cData)
-        cprOffset = 0
+        # The CPR goes straight after the CCR
+        g.seek(0, 2)
+        cprOffset = g.tell() + block_size
         ccr1 = bytearray(32)
         # ccr1[0:4] = binascii.unhexlify(CDF.V3magicNUMBER_1)
         # ccr1[4:8] = binascii.unhexlify(CDF.V3magicNUMBER_2c)
@@ -2104,13 +2205,11 @@ class CDF:
         ccr1[12:20] = struct.pack(">q", cprOffset)
         ccr1[20:28] = struct.pack(">q", uSize)
         ccr1[28:32] = struct.pack(">i", rfuA)
-        g.seek(0, 2)
         g.write(ccr1)
         g.write(cData)
-        cprOffset = self._write_cpr(g, self.GZIP_COMPRESSION, level)
-        self._update_offset_value(g, 20, 8, cprOffset)
+        self._write_cpr(g, self.GZIP_COMPRESSION, level)
 
-    def _convert_option(self) -> str:
+    def _convert_option(self) -> Literal["<", ">", "="]:
         """
         Determines which symbol to use for numpy conversions
         > : a little endian system to big endian ordering
@@ -2129,6 +2228,7 @@ class CDF:
             or self._encoding == 18
         ):
             data_endian = "big"
+        order: Literal["<", ">", "="]
         if sys.byteorder == "little" and data_endian == "big":
             # big->little
             order = ">"
@@ -2263,7 +2363,9 @@ class CDF:
             The stream of bytes to write to the CDF file
         """
         tofrom = self._convert_option()
-        npdata = self._convert_nptype(data_type, indata)
+        # CDF records are stored row-major; make the input a single C-ordered
+        # block up front (this is a no-op for arrays that already are)
+        indata = np.ascontiguousarray(indata)
         if indata.size == 0:  # Check if the data being read in is zero size
             recs = 0
         elif indata.size == num_values * num_elems:  # Check if only one record is being read in
@@ -2273,10 +2375,26 @@ class CDF:
         dt_string = self._convert_type(data_type)
         if data_type == self.CDF_EPOCH16:
             num_elems = 2 * num_elems
-        form = str(recs * num_values * num_elems) + dt_string
-        form2 = tofrom + str(recs * num_values * num_elems) + dt_string
-        datau = struct.unpack(form, npdata)
-        return recs, struct.pack(form2, *datau)
+        count = recs * num_values * num_elems
+        if dt_string in ("", "s"):
+            npdata = self._convert_nptype(data_type, indata)
+            form = str(count) + dt_string
+            form2 = tofrom + str(count) + dt_string
+            datau = struct.unpack(form, npdata)
+            return recs, struct.pack(form2, *datau)
+
+        # Numeric data: cast straight to the type and byte order used in the
+        # file. This doesn't copy if the array already has them, and numpy
+        # does any byte swapping as part of the cast.
+        if data_type == self.CDF_EPOCH16:
+            file_dtype = np.dtype(np.complex128).newbyteorder(tofrom)
+        else:
+            file_dtype = np.dtype(dt_string).newbyteorder(tofrom)
+        odata = np.asarray(indata, dtype=file_dtype)
+        nbytes = count * np.dtype(dt_string).itemsize
+        if odata.nbytes != nbytes:
+            raise struct.error(f"unpack requires a buffer of {nbytes} bytes")
+        return recs, odata.tobytes()
 
     def _convert_data(self, data_type: int, num_elems: int, num_values: int, indata: Any) -> Tuple[int, bytes]:
         """
@@ -2465,7 +2583,7 @@ class CDF:
                         values = values * dimSizes[x]
             return values
 
-    def _read_offset_value(self, f: io.BufferedWriter, offset: int, size: int) -> int:
+    def _read_offset_value(self, f: BinaryIO, offset: int, size: int) -> int:
         """
         Reads an integer value from file "f" at location "offset".
         """
@@ -2475,7 +2593,7 @@ class CDF:
         else:
             return int.from_bytes(f.read(4), "big", signed=True)
 
-    def _update_offset_value(self, f: io.BufferedWriter, offset: int, size: int, value: Any) -> None:
+    def _update_offset_value(self, f: BinaryIO, offset: int, size: int, value: Any) -> None:
         """
         Writes "value" into location "offset" in file "f".
         """
@@ -2485,7 +2603,7 @@ class CDF:
         else:
             f.write(struct.pack(">i", value))
 
-    def _update_aedr_link(self, f: io.BufferedWriter, attrNum: int, zVar: bool, varNum: int, offset: int) -> None:
+    def _update_aedr_link(self, f: BinaryIO, attrNum: int, zVar: bool, varNum: int, offset: int) -> None:
         """
         Updates variable aedr links
 
@@ -2601,24 +2719,27 @@ class CDF:
         else:
             return isinstance(obj, numbers.Number) or isinstance(obj, np.datetime64)
 
-    def _md5_compute(self, f: io.BufferedWriter) -> bytes:
+    def _md5_compute(self, f: BinaryIO) -> bytes:
         """
         Computes the checksum of the file
         """
         md5 = hashlib.md5()
-        block_size = 16384
+        block_size = 1048576
         f.seek(0, 2)
         remaining = f.tell()
         f.seek(0)
 
-        while remaining > block_size:
-            data = f.read(block_size)
-            remaining = remaining - block_size
-            md5.update(data)
-
-        if remaining > 0:
-            data = f.read(remaining)
-            md5.update(data)
+        # Read into one reused buffer rather than allocating a new bytes
+        # object for every block (the buffered file object has readinto,
+        # even though BinaryIO doesn't declare it)
+        readinto = cast(io.BufferedRandom, f).readinto
+        buffer = memoryview(bytearray(block_size))
+        while remaining > 0:
+            nread = readinto(buffer[: min(block_size, remaining)])
+            if not nread:
+                break
+            md5.update(buffer[:nread])
+            remaining = remaining - nread
 
         return md5.digest()
 
@@ -2645,37 +2766,20 @@ class CDF:
             Output: [[1,4],[10,13],[50,53]]
         """
 
-        sparse_blocks = []
-        total = len(records)
-        if total == 0:
+        records = np.asarray(records)
+        if records.size == 0:
             return []
 
-        x = 0
-        while x < total:
-            recstart = records[x]
-            y = x
-            recnum = recstart
-
-            # Find the location in the records before the next gap
-            # Call this value "y"
-            while (y + 1) < total:
-                y = y + 1
-                nextnum = records[y]
-                diff = nextnum - recnum
-                if diff == 1:
-                    recnum = nextnum
-                else:
-                    y = y - 1
-                    break
-
-            if (y + 1) == total:
-                recend = records[total - 1]
-            else:
-                recend = records[y]
-            x = y + 1
-            sparse_blocks.append((recstart, recend))
-
-        return sparse_blocks
+        # A new block starts wherever a record doesn't directly follow the
+        # one before it, and ends just before the next one starts. Both masks
+        # are filled in place, rather than concatenating index arrays.
+        starts = np.empty(records.size, dtype=bool)
+        starts[0] = True
+        np.not_equal(np.diff(records), 1, out=starts[1:])
+        ends = np.empty_like(starts)
+        ends[:-1] = starts[1:]
+        ends[-1] = True
+        return list(zip(records[starts].tolist(), records[ends].tolist()))
 
     def _make_sparse_blocks(self, variable, records, data: List[Tuple[int, int, np.ndarray]]):  # type: ignore[no-untyped-def]
         """
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from numbers import Number
 from pathlib import Path
@@ -7,8 +8,12 @@ import numpy as np
 
 __all__ = ["ADRInfo", "CDFInfo", "CDRInfo", "GDRInfo", "VDRInfo", "AEDR", "VDR", "AEDR", "AttData"]
 
+# Internal records are created once per record in the file, so drop the
+# per-instance __dict__ where dataclasses support it (Python >= 3.10)
+_record_kwargs = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_record_kwargs)
 class ADRInfo:
     scope: int
     next_adr_loc: int
@@ -55,7 +60,7 @@ class CDFInfo:
     LeapSecondUpdate: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_record_kwargs)
 class CDRInfo:
     encoding: int
     copyright_: str
@@ -66,7 +71,7 @@ class CDRInfo:
     post25: bool
 
 
-@dataclass
+@dataclass(**_record_kwargs)
 class GDRInfo:
     first_zvariable: int
     first_rvariable: int
@@ -115,7 +120,7 @@ class VDRInfo:
     Block_Factor: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_record_kwargs)
 class AEDR:
     entry: Union[str, np.ndarray]
     data_type: int
@@ -125,7 +130,7 @@ class AEDR:
     num_strings: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_record_kwargs)
 class VDR:
     data_type: int
     section_type: int
@@ -95,8 +95,12 @@ class CDFepoch:
             LTS.append(row)
 
     NDAT = len(LTS)
+    # Array copy of the leap second table, and the month (12 * year + month)
+    # each entry starts on, for vectorised lookups
+    LTS_ARRAY = np.array(LTS)
+    LTS_MONTHS = (12 * LTS_ARRAY[:, 0] + LTS_ARRAY[:, 1]).astype(np.int64)
 
-    NST: Optional[List[int]] = None
+    NST: Optional[npt.NDArray[np.int64]] = None
     currentDay = -1
     currentJDay = -1
     currentLeapSeconds: float = -1
@@ -761,13 +765,8 @@ class CDFepoch:
 
     @staticmethod
     def _LeapSecondsfromYMD(year: int, month: int, day: int) -> float:
-        j = -1
         m = 12 * year + month
-        for i, _ in reversed(list(enumerate(CDFepoch.LTS))):
-            n = 12 * CDFepoch.LTS[i][0] + CDFepoch.LTS[i][1]
-            if m >= n:
-                j = i
-                break
+        j = int(np.searchsorted(CDFepoch.LTS_MONTHS, m, side="right")) - 1
         if j == -1:
             return 0
         da = CDFepoch.LTS[j][3]
@@ -781,37 +780,34 @@ class CDFepoch:
     def _LeapSecondsfromJ2000(nanosecs: npt.ArrayLike) -> npt.NDArray:
         nanosecs = np.atleast_1d(nanosecs)
         da = np.zeros((nanosecs.size, 2))
-        j = -1 * np.ones(nanosecs.size, dtype=int)
 
         if CDFepoch.NST is None:
             CDFepoch._LoadLeapNanoSecondsTable()
-        for i, _ in reversed(list(enumerate(CDFepoch.NST))):
-            idxs = (j == -1) & (nanosecs >= CDFepoch.NST[i])
-            j[idxs] = i
-            if i < (CDFepoch.NDAT - 1):
-                overflow = nanosecs + 1000000000 >= CDFepoch.NST[i + 1]
-                da[overflow, 1] = 1.0
-            if np.all(j > 0):
-                break
-
-        LTS = np.array(CDFepoch.LTS)
-        da[:, 0] = LTS[j, 3]
+        # Index of the last leap second at or before each time
+        j = np.searchsorted(CDFepoch.NST, nanosecs, side="right") - 1
+        # Flag times within one second of the next leap second
+        nxt = np.minimum(j + 1, CDFepoch.NDAT - 1)
+        overflow = (j < CDFepoch.NDAT - 1) & (nanosecs + 1000000000 >= CDFepoch.NST[nxt])
+        da[overflow, 1] = 1.0
+
+        da[:, 0] = CDFepoch.LTS_ARRAY[j, 3]
         da[j <= CDFepoch.NERA1, 0] = 0
         return da
 
     @staticmethod
     def _LoadLeapNanoSecondsTable() -> None:
-        CDFepoch.NST = []
+        nst = []
         for ix in range(0, CDFepoch.NERA1):
-            CDFepoch.NST.append(CDFepoch.FILLED_TT2000_VALUE)
+            nst.append(CDFepoch.FILLED_TT2000_VALUE)
         for ix in range(CDFepoch.NERA1, CDFepoch.NDAT):
-            CDFepoch.NST.append(
+            nst.append(
                 int(
                     CDFepoch.compute_tt2000(
                         [int(CDFepoch.LTS[ix][0]), int(CDFepoch.LTS[ix][1]), int(CDFepoch.LTS[ix][2]), 0, 0, 0, 0, 0, 0]
                     )
                 )
             )
+        CDFepoch.NST = np.array(nst, dtype=np.int64)
 
     @staticmethod
     def _EPOCHbreakdownTT2000(epoch: npt.ArrayLike) -> npt.NDArray:
@@ -253,32 +253,34 @@ def _verify_depend_dimensions(
     terminate_on_warning: bool = False,
 ) -> bool:
     try:
-        primary_data = np.array(dataset[primary_variable_name])
-        coordinate_data = np.array(dataset[coordinate_variable_name])
+        # Only the shapes are needed, so there is no need to load (or copy) the data
+        primary_shape = dataset[primary_variable_name].shape
+        coordinate_shape = dataset[coordinate_variable_name].shape
+        primary_attrs = dataset[primary_variable_name].attrs
 
-        if len(primary_data.shape) != 0 and len(coordinate_data.shape) == 0:
+        if len(primary_shape) != 0 and len(coordinate_shape) == 0:
             _warn_or_except(
                 f"ISTP Compliance Warning: {coordinate_variable_name} is listed as the DEPEND_{dimension_number} for variable {primary_variable_name}, but the dimensions do not match.",
                 terminate_on_warning,
             )
             return False
 
-        if len(coordinate_data.shape) != 0 and len(primary_data.shape) == 0:
+        if len(coordinate_shape) != 0 and len(primary_shape) == 0:
             _warn_or_except(
                 f"ISTP Compliance Warning: {coordinate_variable_name} is listed as the DEPEND_{dimension_number} for variable {primary_variable_name}, but the dimensions do not match.",
                 terminate_on_warning,
             )
             return False
 
-        if len(coordinate_data.shape) > 2:
+        if len(coordinate_shape) > 2:
             _warn_or_except(
                 f"ISTP Compliance Warning: {coordinate_variable_name} has too many dimensions to be the DEPEND_{dimension_number} for variable {primary_variable_name}",
                 terminate_on_warning,
             )
             return False
 
-        if len(coordinate_data.shape) == 2:
-            if primary_data.shape[0] != coordinate_data.shape[0]:
+        if len(coordinate_shape) == 2:
+            if primary_shape[0] != coordinate_shape[0]:
                 _warn_or_except(
                     f"ISTP Compliance Warning: {coordinate_variable_name} is listed as the DEPEND_{dimension_number} for variable {primary_variable_name}, but the Epoch dimensions do not match.",
                     terminate_on_warning,
@@ -287,7 +289,7 @@ def _verify_depend_dimensions(
 
         # All variables should have at the very least a size of dimension_number
         # (i.e. a variable with a DEPEND_2 should have 2 dimensions)
-        if len(primary_data.shape) < dimension_number:
+        if len(primary_shape) < dimension_number:
             _warn_or_except(
                 f"ISTP Compliance Warning: {coordinate_variable_name} is listed as the DEPEND_{dimension_number} for variable {primary_variable_name}, but {primary_variable_name} does not have that many dimensions",
                 terminate_on_warning,
@@ -296,9 +298,9 @@ def _verify_depend_dimensions(
 
         # All variables with a DEPEND_0 should always have a shape size of at least dimension_number + 1
         # (i.e. a variable with a DEPEND_2 should have 2 dimensions, 2 for DEPEND_1 and DEPEND_2, and 1 for DEPEND_0)
-        if len(primary_data.shape) < dimension_number + 1:
-            if "VAR_TYPE" in dataset[primary_variable_name].attrs:
-                if dataset[primary_variable_name].attrs["VAR_TYPE"] == "data":
+        if len(primary_shape) < dimension_number + 1:
+            if "VAR_TYPE" in primary_attrs:
+                if primary_attrs["VAR_TYPE"] == "data":
                     # Data variables should always have as many dimensions as their are DEPENDS
                     _warn_or_except(
                         f"ISTP Compliance Warning: {coordinate_variable_name} is listed as the DEPEND_{dimension_number} for variable {primary_variable_name}, but {primary_variable_name} does not have that many dimensions. Variables with attribute VAR_TYPE=Data should always have the same number of DEPEND attributes and dimensions.",
@@ -306,7 +308,7 @@ def _verify_depend_dimensions(
                     )
                     return False
                 else:
-                    for key in dataset[primary_variable_name].attrs:
+                    for key in primary_attrs:
                         if key.lower() == "depend_0":
                             # support_data variables with a DEPEND_0 should always match the dimension number
                             _warn_or_except(
@@ -317,15 +319,15 @@ def _verify_depend_dimensions(
 
         # Check that the size of the dimension that DEPEND_{i} is refering to is
         # also the same size of the DEPEND_{i}'s last dimension
-        if any(k.lower() == "depend_0" for k in dataset[primary_variable_name].attrs):
-            if primary_data.shape[dimension_number] != coordinate_data.shape[-1]:
+        if any(k.lower() == "depend_0" for k in primary_attrs):
+            if primary_shape[dimension_number] != coordinate_shape[-1]:
                 _warn_or_except(
                     f"ISTP Compliance Warning: {coordinate_variable_name} is listed as the DEPEND_{dimension_number} for variable {primary_variable_name}, but the dimensions do not match.",
                     terminate_on_warning,
                 )
                 return False
         else:
-            if primary_data.shape[dimension_number - 1] != coordinate_data.shape[-1]:
+            if primary_shape[dimension_number - 1] != coordinate_shape[-1]:
                 _warn_or_except(
                     f"ISTP Compliance Warning: {coordinate_variable_name} is listed as the DEPEND_{dimension_number} for variable {primary_variable_name}, but the dimensions do not match.",
                     terminate_on_warning,
@@ -381,17 +383,17 @@ def _dimension_checker(dataset: xr.Dataset, terminate_on_warning: bool = False)
                     var_type = None
 
             # Determine ISTP compliant variables
-            for att in dataset[var].attrs:
+            for att, depend_i in dataset[var].attrs.items():
                 if depend_regex.match(att.lower()) and att != "DEPEND_0":
-                    if (dataset[var].attrs[att] in dataset) or (dataset[var].attrs[att] in dataset.coords):
-                        depend_i = dataset[var].attrs[att]
+                    # Coordinates are variables of the dataset too
+                    if depend_i in dataset.variables:
                         if _verify_depend_dimensions(
                             dataset, int(att[-1]), var, depend_i, terminate_on_warning=terminate_on_warning
                         ):
-                            istp_depend_dimension_list.append(dataset[var].attrs[att])
+                            istp_depend_dimension_list.append(depend_i)
                     else:
                         _warn_or_except(
-                            f"ISTP Compliance Warning: variable {var} listed {dataset[var].attrs[att]} as its {att}.  However, it was not found in the dataset.",
+                            f"ISTP Compliance Warning: variable {var} listed {depend_i} as its {att}.  However, it was not found in the dataset.",
                             terminate_on_warning,
                         )
 
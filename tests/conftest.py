@@ -1,11 +1,175 @@
+import contextlib
+import os
 import pathlib
+import shutil
+import socket
+import tempfile
+import urllib.error
+import urllib.request
+from typing import Optional
 
 import pytest
+from hypothesis import settings
 
+from cdflib import CDF
 
-@pytest.fixture(params=["psp_fld_l2_mag_rtn_1min_20200104_v02.cdf", "de2_ion2s_rpa_19830213_v01.cdf"])
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
+
+#: Set this environment variable to run the tests that need network access
+#: (same as passing ``--remote-data``).
+NETWORK_TESTS_ENV = "CDFLIB_ENABLE_NETWORK_TESTS"
+
+#: Directory holding the CDF files that ship with the tests
+TEST_FILES = pathlib.Path(__file__).parent.resolve() / "testfiles"
+
+#: Where the (larger) test files that are downloaded by the network tests live
+REMOTE_TEST_FILES = "https://lasp.colorado.edu/maven/sdc/public/data/sdc/web/cdflib_testing/"
+#: Set this environment variable to a directory holding a copy of the remote
+#: test files to use them from there instead of downloading them
+TEST_DATA_DIR_ENV = "CDFLIB_TEST_DATA_DIR"
+
+# Hypothesis profiles; "fast" is used unless HYPOTHESIS_PROFILE says otherwise
+settings.register_profile("fast", max_examples=25, deadline=None)
+settings.register_profile("thorough", max_examples=200, deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "fast"))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--full-roundtrip",
+        action="store_true",
+        help="check the data read back by the remote xarray round-trip tests against the original datasets",
+    )
+
+
+def pytest_configure(config):
+    if os.environ.get(NETWORK_TESTS_ENV):
+        config.option.remote_data = "any"
+
+
+def available_memory() -> Optional[int]:
+    """
+    Returns the memory available to new processes in bytes, or None where
+    this can't be found (anywhere but Linux).
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests that need network access at collection time, so that offline
+    runs never wait on a socket timeout, and tests marked as needing more
+    memory than is available.
+    """
+    skip_remote = None
+    if config.getoption("remote_data") == "none":
+        skip_remote = pytest.mark.skip(reason=f"need --remote-data option or {NETWORK_TESTS_ENV}=1 to run")
+    available = available_memory()
+    for item in items:
+        if skip_remote is not None and "remote_data" in item.keywords:
+            item.add_marker(skip_remote)
+        memory = item.get_closest_marker("memory")
+        if memory is not None and available is not None and available < memory.kwargs["gb"] * 1e9:
+            item.add_marker(pytest.mark.skip(reason=f"needs {memory.kwargs['gb']} GB of available memory"))
+
+
+@pytest.fixture(scope="module", params=["psp_fld_l2_mag_rtn_1min_20200104_v02.cdf", "de2_ion2s_rpa_19830213_v01.cdf"])
 def cdf_path(request):
     """
     Returns a series of CDF file paths which can be used for smoke testing.
     """
-    return (pathlib.Path(__file__) / ".." / "testfiles" / request.param).resolve()
+    return TEST_FILES / request.param
+
+
+@pytest.fixture(scope="module")
+def opened_cdf(cdf_path):
+    """
+    Returns an open CDF for each of the smoke testing files, shared between
+    all of the tests in a module.
+    """
+    cdf = CDF(cdf_path)
+    yield cdf
+    cdf.close()
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """
+    Holds an exclusive lock on path, so only one test process (e.g. one
+    pytest-xdist worker) at a time gets past it. Does nothing where fcntl
+    isn't available.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path, "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def download(url: str, path: pathlib.Path) -> None:
+    """
+    Downloads url to path. The file is downloaded to a temporary file and
+    renamed into place, so an interrupted download (or a parallel test run)
+    never leaves a partial file at path.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+        try:
+            # The timeout is per socket operation, so large files still download
+            with urllib.request.urlopen(url, timeout=30) as response:
+                shutil.copyfileobj(response, tmp, 1024 * 1024)
+                # urllib doesn't complain if the connection drops early
+                expected = response.headers.get("Content-Length")
+                if expected is not None and tmp.tell() != int(expected):
+                    raise ConnectionError(f"only downloaded {tmp.tell()} of {expected} bytes")
+        except BaseException:
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+    os.replace(tmp.name, path)
+
+
+@pytest.fixture(scope="session")
+def remote_file(pytestconfig):
+    """
+    Returns a function that downloads one of the remote test files and
+    returns its path. Files are kept in the pytest cache directory, so each
+    one is only downloaded once, and not again on later test runs. Files in
+    the local mirror given by the ``CDFLIB_TEST_DATA_DIR`` environment
+    variable are used directly.
+    """
+    cache = pathlib.Path(pytestconfig.cache.mkdir("cdflib_remote"))
+    mirror = os.environ.get(TEST_DATA_DIR_ENV)
+
+    def get(fname):
+        if mirror and (pathlib.Path(mirror) / fname).exists():
+            return pathlib.Path(mirror) / fname
+        path = cache / fname
+        if path.exists():
+            return path
+        # Only one process downloads each file, the others wait for it and
+        # then find it in the cache
+        with file_lock(cache / f"{fname}.lock"):
+            if not path.exists():
+                # socket.timeout is only an alias of TimeoutError from Python 3.10
+                try:
+                    download(REMOTE_TEST_FILES + fname, path)
+                except (urllib.error.URLError, ConnectionError, TimeoutError, socket.timeout) as excp:
+                    pytest.skip(f"problem downloading {fname}: {excp}")
+        return path
+
+    return get
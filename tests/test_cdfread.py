@@ -3,28 +3,68 @@ import pytest
 from cdflib import CDF
 
 
-def test_read(cdf_path):
-    cdf = CDF(cdf_path)
-
-    info = cdf.cdf_info()
+def test_read(opened_cdf):
+    info = opened_cdf.cdf_info()
 
     # Smoke test variable access
     for var in info.zVariables:
-        cdf.varattsget(var)
-        cdf.varget(var)
-
-    # Smoke test context manager
-    with CDF(cdf_path) as cdf:
-        cdf.cdf_info()
+        opened_cdf.varattsget(var)
+        opened_cdf.varget(var)
 
     # Smoke test global attributes
-    globalatts = cdf.globalattsget()
+    globalatts = opened_cdf.globalattsget()
     for att in globalatts:
         if len(globalatts[att]) > 1:
             # Make sure multiple entries are unique
             assert len(globalatts[att]) == len(set(globalatts[att]))
 
 
+def test_cached_info(opened_cdf):
+    # Repeated calls are served from a cache, but callers still get their own copy
+    info = opened_cdf.cdf_info()
+    assert opened_cdf.cdf_info() == info
+    info.zVariables.append("not a variable")
+    assert opened_cdf.cdf_info().zVariables == info.zVariables[:-1]
+
+    globalatts = opened_cdf.globalattsget()
+    assert opened_cdf.globalattsget() == globalatts
+    globalatts.clear()
+    assert opened_cdf.globalattsget() != globalatts
+
+    var = info.zVariables[0]
+    varinfo = opened_cdf.varinq(var)
+    assert opened_cdf.varinq(var) == varinfo
+    varinfo.Dim_Sizes.append(-1)
+    assert opened_cdf.varinq(var).Dim_Sizes == varinfo.Dim_Sizes[:-1]
+
+    attinfo = opened_cdf.attinq(0)
+    assert opened_cdf.attinq(attinfo.name) == attinfo
+    attinfo.name = "not an attribute"
+    assert opened_cdf.attinq(0) != attinfo
+
+
+def test_close_clears_cache(cdf_path):
+    cdf = CDF(cdf_path)
+    cdf.varinq(cdf.cdf_info().zVariables[0])
+    cdf.attinq(0)
+    cdf.globalattsget()
+    cdf.close()
+    assert cdf._cdf_info_cache is None
+    assert cdf._globalatts_cache is None
+    assert cdf._vdr_cache == {}
+    assert cdf._adr_cache == {}
+
+
+def test_context(cdf_path):
+    # Smoke test context manager
+    with CDF(cdf_path) as cdf:
+        var = cdf.cdf_info().zVariables[0]
+        cdf.varget(var)
+    # The file is closed on leaving the context
+    with pytest.raises(ValueError, match="closed file"):
+        cdf.varget(var)
+
+
 def test_nonexist_file_errors(tmp_path):
     with pytest.raises(FileNotFoundError, match="not found"):
         CDF(tmp_path / "nonexist.cdf")
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Any, Dict
 
@@ -7,8 +8,14 @@ import pytest
 from cdflib import cdfread, cdfwrite
 from cdflib.xarray import cdf_to_xarray
 
-R = Path(__file__).parent
 fnbasic = "testing.cdf"
+#: Records written by the non-sparse blocking test. 64 blocks of 10000 is the
+#: fewest that still need two levels of VXRs above the data; set
+#: CDFLIB_STRESS=1 to write a million records instead.
+NUM_BLOCKING_RECS = 1_000_000 if os.environ.get("CDFLIB_STRESS") else 640_000
+#: Physical records of the sparse blocking tests: four runs, with gaps
+#: between them, over records 0 to 140000
+SPARSE_BLOCKING_RECORDS = np.r_[1:10001, 20001:30001, 50001:60001, 70001:140001]
 
 
 def cdf_create(fn: Path, spec: Dict[str, Any]) -> cdfwrite.CDF:
@@ -19,6 +26,21 @@ def cdf_read(fn: Path, validate: bool = False) -> cdfread.CDF:
     return cdfread.CDF(fn, validate=validate)
 
 
+@pytest.fixture(scope="module")
+def make_var_spec():
+    """
+    Builds a var_spec for a single-element, record-varying scalar
+    variable, with any of the keys overridden
+    """
+
+    def _make_var_spec(**overrides: Any) -> Dict[str, Any]:
+        var_spec: Dict[str, Any] = {"Variable": "Variable1", "Num_Elements": 1, "Rec_Vary": True, "Dim_Sizes": []}
+        var_spec.update(overrides)
+        return var_spec
+
+    return _make_var_spec
+
+
 def test_cdf_creation(tmp_path):
     fn = tmp_path / fnbasic
     cdf_create(fn, {"rDim_sizes": [1]}).close()
@@ -30,22 +52,18 @@ def test_cdf_creation(tmp_path):
     assert info.Majority == "Row_major"
 
 
-def test_checksum(tmp_path):
+@pytest.mark.checksum
+def test_checksum(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
     tfile = cdf_create(fn, {"Checksum": True})
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 4
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
+    var_spec = make_var_spec(Data_Type=4)
     varatts: Dict[str, Any] = {}
     varatts["Attribute1"] = 1
     varatts["Attribute2"] = "500"
 
-    tfile.write_var(var_spec, var_attrs=varatts, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+    tfile.write_var(var_spec, var_attrs=varatts, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int32))
 
     tfile.close()
 
@@ -58,30 +76,31 @@ def test_checksum(tmp_path):
     np.testing.assert_equal(reader["Variable1"], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
 
 
-def test_checksum_compressed(tmp_path):
-    # Setup the test_file
-    fn = tmp_path / fnbasic
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 2
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
+@pytest.fixture(scope="module")
+def compressed_checksummed_cdf(tmp_path_factory, make_var_spec):
+    """
+    Writes a compressed, checksummed CDF once, and returns its path for the
+    tests that read it back in different ways
+    """
+    fn = tmp_path_factory.mktemp("compressed") / fnbasic
+    var_spec = make_var_spec(Data_Type=2)
     varatts: Dict[str, Any] = {}
     varatts["Attribute1"] = 1
     varatts["Attribute2"] = "500"
 
-    v = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
-
     tfile = cdf_create(fn, {"Compressed": 6, "Checksum": True})
-    tfile.write_var(var_spec, var_attrs=varatts, var_data=v)
-
+    tfile.write_var(var_spec, var_attrs=varatts, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int16))
     tfile.close()
+    return fn
+
+
+@pytest.mark.checksum
+def test_checksum_compressed(compressed_checksummed_cdf):
     # Open the file to read
-    reader = cdf_read(fn, validate=True)
+    reader = cdf_read(compressed_checksummed_cdf, validate=True)
 
     var = reader.varget("Variable1")
-    np.testing.assert_equal(var, v)
+    np.testing.assert_equal(var, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
 
     att = reader.attget("Attribute1", entry=0)
     assert att.Data == 1
@@ -90,112 +109,74 @@ def test_checksum_compressed(tmp_path):
     assert att.Data == "500"
 
 
-def test_file_compression(tmp_path):
-    # Setup the test_file
-    fn = tmp_path / fnbasic
-
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 2
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    varatts: Dict[str, Any] = {}
-    varatts["Attribute1"] = 1
-    varatts["Attribute2"] = "500"
-
-    v = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
-
-    tfile = cdf_create(fn, {"Compressed": 6, "Checksum": True})
-    tfile.write_var(var_spec, var_attrs=varatts, var_data=v)
-    tfile.close()
-
+def test_file_compression(compressed_checksummed_cdf):
     # Open the file to read
-    reader = cdf_read(fn)
+    reader = cdf_read(compressed_checksummed_cdf)
     # Test CDF info
     var = reader.varget("Variable1")
-    np.testing.assert_equal(var, v)
-
-
-def test_globalattrs(tmp_path):
-    # Setup the test_file
-    fn = tmp_path / fnbasic
-
-    globalAttrs: Dict[str, Any] = {}
-    globalAttrs["Global1"] = {0: "Global Value 1"}
-    globalAttrs["Global2"] = {0: "Global Value 2"}
-    globalAttrs["Global3"] = {0: [12, "cdf_int4"]}
-    globalAttrs["Global4"] = {0: [12.34, "cdf_double"]}
-    globalAttrs["Global5"] = {0: [12.34, 21.43]}
+    np.testing.assert_equal(var, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
 
-    GA6: Dict[int, Any] = {}
-    GA6[0] = "abcd"
-    GA6[1] = [12, "cdf_int2"]
-    GA6[2] = [12.5, "cdf_float"]
-    GA6[3] = [[0, 1, 2], "cdf_int8"]
 
-    globalAttrs["Global6"] = GA6
+@pytest.fixture(scope="module")
+def checksummed_cdf(tmp_path_factory, make_var_spec):
+    """
+    Writes a checksummed CDF with global attributes and a zVariable once,
+    and returns it opened for reading, shared between the tests that only
+    read it back
+    """
+    fn = tmp_path_factory.mktemp("checksummed") / fnbasic
+
+    globalAttrs: Dict[str, Any] = {
+        "Global1": {0: "Global Value 1"},
+        "Global2": {0: "Global Value 2"},
+        "Global3": {0: [12, "cdf_int4"]},
+        "Global4": {0: [12.34, "cdf_double"]},
+        "Global5": {0: [12.34, 21.43]},
+        "Global6": {0: "abcd", 1: [12, "cdf_int2"], 2: [12.5, "cdf_float"], 3: [[0, 1, 2], "cdf_int8"]},
+    }
 
     tfile = cdf_create(fn, {"Checksum": True})
     tfile.write_globalattrs(globalAttrs)
-
+    vs = make_var_spec(Data_Type=1, Dim_Vary=True)
+    tfile.write_var(vs, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int8))
     tfile.close()
+
     # Open the file to read
     reader = cdf_read(fn)
+    yield reader
+    reader.close()
+
 
+def test_globalattrs(checksummed_cdf):
     # Test CDF info
-    attrib = reader.attinq("Global2")
+    attrib = checksummed_cdf.attinq("Global2")
     assert attrib.num_gr_entry == 1
 
-    attrib = reader.attinq("Global6")
+    attrib = checksummed_cdf.attinq("Global6")
     assert attrib.num_gr_entry == 4
 
-    entry = reader.attget("Global6", 3)
+    entry = checksummed_cdf.attget("Global6", 3)
     assert entry.Data_Type == "CDF_INT8"
 
     np.testing.assert_equal(entry.Data, [0, 1, 2])
 
 
-def test_create_zvariable(tmp_path):
-    # Setup the test_file
-    fn = tmp_path / fnbasic
-    vs: Dict[str, Any] = {}
-    vs["Variable"] = "Variable1"
-    vs["Data_Type"] = 1
-    vs["Num_Elements"] = 1
-    vs["Rec_Vary"] = True
-    vs["Dim_Sizes"] = []
-    vs["Dim_Vary"] = True
-
-    tfile = cdf_create(fn, {"Checksum": True})
-    tfile.write_var(vs, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
-    tfile.close()
-
-    # Open the file to read
-    reader = cdf_read(fn)
-
+def test_create_zvariable(checksummed_cdf):
     # Test CDF info
-    varinfo = reader.varinq("Variable1")
+    varinfo = checksummed_cdf.varinq("Variable1")
     assert varinfo.Data_Type == 1
 
-    var = reader.varget("Variable1")
+    var = checksummed_cdf.varget("Variable1")
     np.testing.assert_equal(var, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
 
 
-def test_create_rvariable(tmp_path):
+def test_create_rvariable(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
-    vs: Dict[str, Any] = {}
-    vs["Variable"] = "Variable1"
-    vs["Var_Type"] = "rvariable"
-    vs["Data_Type"] = 12
-    vs["Num_Elements"] = 1
-    vs["Rec_Vary"] = True
-    vs["Dim_Sizes"] = []
-    vs["Dim_Vary"] = [True]
+    vs = make_var_spec(Var_Type="rvariable", Data_Type=12, Dim_Vary=[True])
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
-    tfile.write_var(vs, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+    tfile.write_var(vs, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.uint16))
     tfile.close()
 
     # Open the file to read
@@ -206,24 +187,17 @@ def test_create_rvariable(tmp_path):
     assert varinfo.Data_Type == 12
 
     var = reader.varget("Variable1")
-    for x in [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
-        assert var[x] == x
+    np.testing.assert_equal(var, np.arange(11)[:, None])
 
 
-def test_create_zvariable_no_recvory(tmp_path):
+def test_create_zvariable_no_recvory(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = False
-    var_spec["Dim_Sizes"] = []
-    var_spec["Dim_Vary"] = True
+    var_spec = make_var_spec(Data_Type=8, Rec_Vary=False, Dim_Vary=True)
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
-    tfile.write_var(var_spec, var_data=np.array([2]))
+    tfile.write_var(var_spec, var_data=np.array([2], dtype=np.int64))
     tfile.close()
 
     # Open the file to read
@@ -237,29 +211,28 @@ def test_create_zvariable_no_recvory(tmp_path):
     assert var == 2
 
 
-def test_create_zvariables_with_attributes(tmp_path):
+def test_create_zvariables_with_attributes(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
     varatts: Dict[str, Any] = {}
     varatts["Attribute1"] = 1
     varatts["Attribute2"] = "500"
-
-    tfile = cdf_create(fn, {"rDim_sizes": [1]})
-    tfile.write_var(var_spec, var_attrs=varatts, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
-
-    var_spec["Variable"] = "Variable2"
     varatts2: Dict[str, Any] = {}
     varatts2["Attribute1"] = 2
     varatts2["Attribute2"] = "1000"
-    tfile.write_var(var_spec, var_attrs=varatts2, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
 
+    tfile = cdf_create(fn, {"rDim_sizes": [1]})
+    tfile.write_vars(
+        [
+            (make_var_spec(Data_Type=8), varatts, np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int64)),
+            (
+                make_var_spec(Variable="Variable2", Data_Type=8),
+                varatts2,
+                np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int64),
+            ),
+        ]
+    )
     tfile.close()
 
     # Open the file to read
@@ -273,22 +246,17 @@ def test_create_zvariables_with_attributes(tmp_path):
     assert att.Data == "1000"
 
 
-def test_create_zvariables_then_attributes(tmp_path):
+def test_create_zvariables_then_attributes(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
+    var_spec = make_var_spec(Data_Type=8)
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
-    tfile.write_var(var_spec, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+    tfile.write_var(var_spec, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int64))
 
     var_spec["Variable"] = "Variable2"
-    tfile.write_var(var_spec, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+    tfile.write_var(var_spec, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int64))
 
     varatts: Dict[str, Any] = {}
     varatts["Attribute1"] = {"Variable1": 1, "Variable2": 2}
@@ -308,18 +276,33 @@ def test_create_zvariables_then_attributes(tmp_path):
     att.Data == "1000"
 
 
-def test_nonsparse_zvariable_blocking(tmp_path):
+def test_write_vars(tmp_path, make_var_spec):
+    fn = tmp_path / fnbasic
+
+    tfile = cdf_create(fn, {"rDim_sizes": [1]})
+    tfile.write_vars(
+        [
+            (make_var_spec(Data_Type=8), {"Attribute1": 1}, np.arange(11, dtype=np.int64)),
+            (make_var_spec(Variable="Variable2", Data_Type=21, Dim_Sizes=[2]), None, np.ones((3, 2), dtype=np.float32)),
+            (make_var_spec(Variable="Variable3", Data_Type=4), None, None),
+        ]
+    )
+    tfile.close()
+
+    reader = cdf_read(fn)
+    assert reader.cdf_info().zVariables == ["Variable1", "Variable2", "Variable3"]
+    np.testing.assert_equal(reader.varget("Variable1"), np.arange(11))
+    np.testing.assert_equal(reader.varget("Variable2"), np.ones((3, 2)))
+    assert reader.attget("Attribute1", entry="Variable1").Data == 1
+
+
+@pytest.mark.slow
+def test_nonsparse_zvariable_blocking(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    var_spec["Block_Factor"] = 10000
-    data = np.linspace(0, 999999, num=1000000)
+    var_spec = make_var_spec(Data_Type=8, Block_Factor=10000)
+    data = np.arange(NUM_BLOCKING_RECS, dtype=np.int64)
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
     tfile.write_var(var_spec, var_data=data)
@@ -330,27 +313,17 @@ def test_nonsparse_zvariable_blocking(tmp_path):
 
     # Test CDF info
     var = reader.varget("Variable1")
-    assert var[99999] == 99999
+    np.testing.assert_equal(var, data)
 
 
-def test_sparse_virtual_zvariable_blocking(tmp_path):
+@pytest.mark.slow
+def test_sparse_virtual_zvariable_blocking(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    var_spec["Block_Factor"] = 10000
-    var_spec["Sparse"] = "pad_sparse"
-    data = np.linspace(0, 140000, num=140001)
-    physical_records1 = np.linspace(1, 10000, num=10000)
-    physical_records2 = np.linspace(20001, 30000, num=10000)
-    physical_records3 = np.linspace(50001, 60000, num=10000)
-    physical_records4 = np.linspace(70001, 140000, num=70000)
-    physical_records = np.concatenate((physical_records1, physical_records2, physical_records3, physical_records4)).astype(int)
+    var_spec = make_var_spec(Data_Type=8, Block_Factor=10000, Sparse="pad_sparse")
+    data = np.arange(140_001, dtype=np.int64)
+    physical_records = SPARSE_BLOCKING_RECORDS
     sparse_data = [physical_records, data]
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
@@ -365,28 +338,20 @@ def test_sparse_virtual_zvariable_blocking(tmp_path):
     var = reader.varget("Variable1")
 
     pad_num = varinq.Pad[0]
-    assert var[30001] == pad_num
-    assert var[70001] == 70001
+    # Physical records hold their record number, virtual records the pad
+    expected = np.full(140001, pad_num)
+    expected[physical_records] = physical_records
+    np.testing.assert_equal(var, expected)
 
 
-def test_sparse_zvariable_blocking(tmp_path):
+@pytest.mark.slow
+def test_sparse_zvariable_blocking(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    var_spec["Block_Factor"] = 10000
-    var_spec["Sparse"] = "pad_sparse"
-    data = np.linspace(0, 99999, num=100000)
-    physical_records1 = np.linspace(1, 10000, num=10000)
-    physical_records2 = np.linspace(20001, 30000, num=10000)
-    physical_records3 = np.linspace(50001, 60000, num=10000)
-    physical_records4 = np.linspace(70001, 140000, num=70000)
-    physical_records = np.concatenate((physical_records1, physical_records2, physical_records3, physical_records4)).astype(int)
+    var_spec = make_var_spec(Data_Type=8, Block_Factor=10000, Sparse="pad_sparse")
+    data = np.arange(100_000, dtype=np.int64)
+    physical_records = SPARSE_BLOCKING_RECORDS
     sparse_data = [physical_records, data]
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
@@ -397,26 +362,23 @@ def test_sparse_zvariable_blocking(tmp_path):
     reader = cdf_read(fn)
 
     # Test CDF info
-    # tfile = cdf_create(fn, {'rDim_sizes': [1]})
     varinq = reader.varinq("Variable1")
     var = reader.varget("Variable1")
     pad_num = varinq.Pad[0]
 
-    assert var[30001] == pad_num
-    assert var[70001] == 30000
+    expected = np.full(140001, pad_num)
+    expected[physical_records] = data
+    np.testing.assert_equal(var, expected)
 
 
-def test_sparse_zvariable_pad(tmp_path):
+def test_sparse_zvariable_pad(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    var_spec["Sparse"] = "pad_sparse"
-    data = [[200, 3000, 3100, 3500, 4000, 5000, 6000, 10000, 10001, 10002, 20000], np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])]
+    var_spec = make_var_spec(Data_Type=8, Sparse="pad_sparse")
+    data = [
+        np.array([200, 3000, 3100, 3500, 4000, 5000, 6000, 10000, 10001, 10002, 20000], dtype=np.int64),
+        np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int64),
+    ]
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
     tfile.write_var(var_spec, var_data=data)
@@ -434,18 +396,15 @@ def test_sparse_zvariable_pad(tmp_path):
     assert var[3000] == 1
 
 
-def test_sparse_zvariable_previous(tmp_path):
+def test_sparse_zvariable_previous(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    var_spec["Sparse"] = "prev_sparse"
-    data = [[200, 3000, 3100, 3500, 4000, 5000, 6000, 10000, 10001, 10002, 20000], np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])]
+    var_spec = make_var_spec(Data_Type=8, Sparse="prev_sparse")
+    data = [
+        np.array([200, 3000, 3100, 3500, 4000, 5000, 6000, 10000, 10001, 10002, 20000], dtype=np.int64),
+        np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int64),
+    ]
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
     tfile.write_var(var_spec, var_data=data)
@@ -463,23 +422,35 @@ def test_sparse_zvariable_previous(tmp_path):
     assert var[6001] == var[6000]
 
 
-def test_create_2d_rvariable(tmp_path):
+def test_sparse_2d_zvariable_previous(tmp_path, make_var_spec):
+    # Setup the test_file
+    fn = tmp_path / fnbasic
+
+    var_spec = make_var_spec(Data_Type=8, Dim_Sizes=[3], Sparse="prev_sparse", Pad=np.array([-5], dtype=np.int64))
+    data = [[2, 3, 7], np.array([[0, 1, 2], [3, 4, 5], [6, 7, 8]], dtype=np.int64)]
+
+    tfile = cdf_create(fn, {"rDim_sizes": [1]})
+    tfile.write_var(var_spec, var_data=data)
+    tfile.close()
+
+    # Open the file to read
+    reader = cdf_read(fn)
+    var = reader.varget("Variable1")
+    np.testing.assert_equal(var[:2], [[-5, -5, -5], [-5, -5, -5]])
+    np.testing.assert_equal(var[4:7], [[3, 4, 5], [3, 4, 5], [3, 4, 5]])
+    np.testing.assert_equal(reader.varget("Variable1", startrec=5, endrec=7), [[3, 4, 5], [3, 4, 5], [6, 7, 8]])
+
+
+def test_create_2d_rvariable(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Var_Type"] = "rvariable"
-    var_spec["Data_Type"] = 14
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    var_spec["Dim_Vary"] = [True, True]
+    var_spec = make_var_spec(Var_Type="rvariable", Data_Type=14, Dim_Vary=[True, True])
+    # Record x is [[2x, 2x + 1], [2x + 1, 2x + 2]]
+    data = 2 * np.arange(5, dtype=np.uint32)[:, None, None] + np.array([[0, 1], [1, 2]], dtype=np.uint32)
 
     tfile = cdf_create(fn, {"rDim_sizes": [2, 2]})
-    tfile.write_var(
-        var_spec, var_data=np.array([[[0, 1], [1, 2]], [[2, 3], [3, 4]], [[4, 5], [5, 6]], [[6, 7], [7, 8]], [[8, 9], [9, 10]]])
-    )
+    tfile.write_var(var_spec, var_data=data)
     tfile.close()
 
     # Open the file to read
@@ -490,29 +461,18 @@ def test_create_2d_rvariable(tmp_path):
     assert varinfo.Data_Type == 14
 
     var = reader.varget("Variable1")
-    for x in [0, 1, 2, 3, 4]:
-        assert var[x][0][0] == 2 * x
-        assert var[x][0][1] == 2 * x + 1
-        assert var[x][1][0] == 2 * x + 1
-        assert var[x][1][1] == 2 * x + 2
+    np.testing.assert_equal(var, data)
 
 
-def test_create_2d_rvariable_dimvary(tmp_path):
+def test_create_2d_rvariable_dimvary(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Var_Type"] = "rvariable"
-    var_spec["Data_Type"] = 21
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    var_spec["Dim_Vary"] = [True, False]
+    var_spec = make_var_spec(Var_Type="rvariable", Data_Type=21, Dim_Vary=[True, False])
 
     tfile = cdf_create(fn, {"rDim_sizes": [2, 20]})
 
-    tfile.write_var(var_spec, var_data=np.array([[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]))
+    tfile.write_var(var_spec, var_data=np.array([[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]], dtype=np.float32))
 
     tfile.close()
 
@@ -524,34 +484,26 @@ def test_create_2d_rvariable_dimvary(tmp_path):
 
     assert varinfo.Data_Type == 21
     var = reader.varget("Variable1")
-    for x in [0, 1, 2, 3, 4]:
-        assert var[x][0] == 2 * x
-        assert var[x][1] == 2 * x + 1
+    np.testing.assert_equal(var, np.arange(10).reshape(5, 2))
 
 
-def test_create_2d_r_and_z_variables(tmp_path):
+def test_create_2d_r_and_z_variables(tmp_path, make_var_spec):
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Var_Type"] = "rvariable"
-    var_spec["Data_Type"] = 22
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
-    var_spec["Dim_Vary"] = [True, False]
-
-    tfile = cdf_create(fn, {"rDim_sizes": [2, 20]})
-    tfile.write_var(var_spec, var_data=np.array([[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]))
-
-    var_spec["Variable"] = "Variable2"
-    var_spec["Var_Type"] = "zvariable"
+    rvar_spec = make_var_spec(Var_Type="rvariable", Data_Type=22, Dim_Vary=[True, False])
+    zvar_spec = make_var_spec(Variable="Variable2", Data_Type=22)
     varatts: Dict[str, Any] = {}
     varatts["Attribute1"] = 2
     varatts["Attribute2"] = "1000"
-    tfile.write_var(var_spec, var_attrs=varatts, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
 
+    tfile = cdf_create(fn, {"rDim_sizes": [2, 20]})
+    tfile.write_vars(
+        [
+            (rvar_spec, None, np.array([[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]], dtype=np.float64)),
+            (zvar_spec, varatts, np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.float64)),
+        ]
+    )
     tfile.close()
     # Open the file to read
     reader = cdf_read(fn)
@@ -561,9 +513,7 @@ def test_create_2d_r_and_z_variables(tmp_path):
     assert varinfo.Data_Type == 22
 
     var = reader.varget("Variable1")
-    for x in [0, 1, 2, 3, 4]:
-        assert var[x][0] == 2 * x
-        assert var[x][1] == 2 * x + 1
+    np.testing.assert_equal(var, np.arange(10).reshape(5, 2))
 
     var = reader.varget("Variable2")
     np.testing.assert_equal(var, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
@@ -575,24 +525,35 @@ def test_create_2d_r_and_z_variables(tmp_path):
     assert att.Data == "1000"
 
 
-def test_create_zvariables_with_attributes_to_convert(tmp_path):
+def test_create_2d_zvariable_fortran_ordered(tmp_path, make_var_spec):
+    # Setup the test_file
+    fn = tmp_path / fnbasic
+
+    var_spec = make_var_spec(Data_Type=22, Dim_Sizes=[3])
+
+    data = np.asfortranarray(np.arange(15, dtype=np.float64).reshape(5, 3))
+    tfile = cdf_create(fn, {})
+    tfile.write_var(var_spec, var_data=data)
+    tfile.close()
+
+    # Open the file to read
+    reader = cdf_read(fn)
+    np.testing.assert_equal(reader.varget("Variable1"), data)
+
+
+def test_create_zvariables_with_attributes_to_convert(tmp_path, make_var_spec):
     # This unit test verify that attributes will be cast to the appropriate type
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
+    var_spec = make_var_spec(Data_Type=8)
     varatts: Dict[str, Any] = {}
     varatts["Attribute1"] = [1, "CDF_REAL8"]
     varatts["Attribute2"] = [500.1, "CDF_INT8"]
     varatts["Attribute3"] = [700, "CDF_INT8"]
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
-    tfile.write_var(var_spec, var_attrs=varatts, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+    tfile.write_var(var_spec, var_attrs=varatts, var_data=np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.int64))
 
     tfile.close()
 
@@ -607,19 +568,14 @@ def test_create_zvariables_with_attributes_to_convert(tmp_path):
     assert att.Data == 500  # Verifies that it casted correctly and removed the ".1"
 
 
-def test_create_zvariables_with_data_to_convert(tmp_path):
+def test_create_zvariables_with_data_to_convert(tmp_path, make_var_spec):
     # This unit test verify that data given to write_var will be cast to the appropriate type
     # i.e. if CDF_INT8 is specified, then the data will be cast to an int before writing to the file
 
     # Setup the test_file
     fn = tmp_path / fnbasic
 
-    var_spec: Dict[str, Any] = {}
-    var_spec["Variable"] = "Variable1"
-    var_spec["Data_Type"] = 8
-    var_spec["Num_Elements"] = 1
-    var_spec["Rec_Vary"] = True
-    var_spec["Dim_Sizes"] = []
+    var_spec = make_var_spec(Data_Type=8)
 
     tfile = cdf_create(fn, {"rDim_sizes": [1]})
     tfile.write_var(var_spec, var_data=[0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
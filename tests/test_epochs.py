@@ -1,14 +1,11 @@
 #!/usr/bin/env python
-import filecmp
-import os
 import urllib.request
 from datetime import datetime, timedelta
 from pathlib import Path
-from random import randint
 
 import numpy as np
 import pytest
-from hypothesis import example, given, settings, strategies
+from hypothesis import example, given, strategies
 from pytest import approx
 
 from cdflib import epochs
@@ -42,6 +39,8 @@ random_tt2000_dtime = strategies.datetimes(
 # https://spdf.gsfc.nasa.gov/pub/software/cdf/doc/cdf371/cdf371ug.pdf
 # page 55
 random_dtime = strategies.datetimes(min_value=datetime(1709, 1, 1), max_value=(datetime(2293, 1, 1) - timedelta(milliseconds=1)))
+# A microsecond, nanosecond or picosecond field
+random_sub_ms = strategies.integers(0, 999)
 
 
 def test_encode_cdfepoch():
@@ -87,120 +86,70 @@ def test_unixtime():
 
 
 @pytest.mark.parametrize("tzone", ["UTC", "EST"])
-def test_unixtime_roundtrip(tzone):
-    _environ = os.environ.copy()
-    try:
-        os.environ["TZ"] = tzone
-        y, m, d = 2000, 1, 1
-        epoch = cdfepoch.compute_tt2000([[y, m, d]])
-        unixtime = cdfepoch.unixtime(epoch)
-        assert unixtime == 946684800.0
-    finally:
-        os.environ.clear()
-        os.environ.update(_environ)
+def test_unixtime_roundtrip(tzone, monkeypatch):
+    monkeypatch.setenv("TZ", tzone)
+    y, m, d = 2000, 1, 1
+    epoch = cdfepoch.compute_tt2000([[y, m, d]])
+    unixtime = cdfepoch.unixtime(epoch)
+    assert unixtime == 946684800.0
 
 
 def test_breakdown_cdfepoch():
     x = cdfepoch.breakdown([62285326000000.0, 62985326000000.0])
     # First in the array
-    assert x[0][0] == 1973
-    assert x[0][1] == 9
-    assert x[0][2] == 28
-    assert x[0][3] == 23
-    assert x[0][4] == 26
-    assert x[0][5] == 40
-    assert x[0][6] == 0
+    np.testing.assert_array_equal(x[0], [1973, 9, 28, 23, 26, 40, 0])
     # Second in the array
-    assert x[1][0] == 1995
-    assert x[1][1] == 12
-    assert x[1][2] == 4
-    assert x[1][3] == 19
-    assert x[1][4] == 53
-    assert x[1][5] == 20
-    assert x[1][6] == 0
+    np.testing.assert_array_equal(x[1], [1995, 12, 4, 19, 53, 20, 0])
 
 
 def test_breakdown_cdfepoch16():
     x = cdfepoch.breakdown(np.complex128(63300946758.000000 + 176214648000.00000j))
-    assert x[0] == 2005
-    assert x[1] == 12
-    assert x[2] == 4
-    assert x[3] == 20
-    assert x[4] == 19
-    assert x[5] == 18
-    assert x[6] == 176
-    assert x[7] == 214
-    assert x[8] == 648
-    assert x[9] == 000
+    np.testing.assert_array_equal(x, [2005, 12, 4, 20, 19, 18, 176, 214, 648, 0])
 
 
 def test_breakdown_cdftt2000():
     x = cdfepoch.breakdown(123456789101112131)
-    assert x[0] == 2003
-    assert x[1] == 11
-    assert x[2] == 30
-    assert x[3] == 9
-    assert x[4] == 32
-    assert x[5] == 4
-    assert x[6] == 917
-    assert x[7] == 112
-    assert x[8] == 131
-
-
-@given(random_dtime)
-@settings(max_examples=100)
-def test_compute_cdfepoch(dtime):
+    np.testing.assert_array_equal(x, [2003, 11, 30, 9, 32, 4, 917, 112, 131])
+
+
+def test_breakdown_cdftt2000_batch():
+    # Times either side of the 2016-12-31 leap second, batched with an
+    # earlier time, should break down the same as they do one at a time
+    times = [
+        [2016, 12, 31, 23, 59, 59, 500, 0, 0],
+        [2017, 1, 1, 0, 0, 0, 500, 0, 0],
+        [1990, 1, 1, 0, 0, 0, 0, 0, 0],
+    ]
+    tt2000 = cdfepoch.compute(times)
+    x = cdfepoch.breakdown(tt2000)
+    np.testing.assert_array_equal(x, times)
+    np.testing.assert_array_equal(x, [cdfepoch.breakdown(t) for t in np.asarray(tt2000)])
+
+
+@given(strategies.lists(random_dtime, min_size=1, max_size=100))
+def test_compute_cdfepoch(dtimes):
     """
-    Using random numbers for the compute tests
+    Using random numbers for the compute tests, which are round tripped as
+    a single batch
     """
-    random_time = [dtime.year, dtime.month, dtime.day, dtime.hour, dtime.minute, dtime.second, dtime.microsecond // 1000]
-    x = cdfepoch.breakdown(cdfepoch.compute(random_time))
-    i = 0
-    for t in x:
-        assert t == random_time[i], f"Time {random_time} was not equal to {x}"
-        i += 1
-
-
-@given(random_dtime)
-@settings(max_examples=100)
-def test_compute_cdfepoch16(dtime):
-    random_time = [
-        dtime.year,
-        dtime.month,
-        dtime.day,
-        dtime.hour,
-        dtime.minute,
-        dtime.second,
-        dtime.microsecond // 1000,  # Millisecond
-        randint(0, 999),  # Microsecond
-        randint(0, 999),  # Nanosecond
-        randint(0, 999),  # Picosecond
-    ]
-    x = cdfepoch.breakdown(cdfepoch.compute(random_time))
-    i = 0
-    for t in x:
-        assert t == random_time[i], f"Time {random_time} was not equal to {x}"
-        i += 1
-
-
-@given(random_tt2000_dtime)
-@settings(max_examples=100)
-@example(datetime(1972, 1, 1, 0, 0))
-def test_compute_cdftt2000(dtime):
-    random_time = [
-        dtime.year,
-        dtime.month,
-        dtime.day,
-        dtime.hour,
-        dtime.minute,
-        dtime.second,
-        dtime.microsecond // 1000,  # Millisecond
-        randint(0, 999),  # Microsecond
-        randint(0, 999),  # Nanosecond
-    ]
-    x = cdfepoch.breakdown(cdfepoch.compute(random_time))
-    for i, t in enumerate(x):
-        assert t == random_time[i], f"Time {random_time} was not equal to {x}"
+    random_times = [[t.year, t.month, t.day, t.hour, t.minute, t.second, t.microsecond // 1000] for t in dtimes]
+    x = cdfepoch.breakdown(cdfepoch.compute(random_times))
+    np.testing.assert_array_equal(np.atleast_2d(x), random_times)
+
+
+@given(strategies.lists(strategies.tuples(random_dtime, random_sub_ms, random_sub_ms, random_sub_ms), min_size=1, max_size=100))
+def test_compute_cdfepoch16(dtimes):
+    random_times = [[t.year, t.month, t.day, t.hour, t.minute, t.second, t.microsecond // 1000, *sub_ms] for t, *sub_ms in dtimes]
+    x = cdfepoch.breakdown(cdfepoch.compute(random_times))
+    np.testing.assert_array_equal(np.atleast_2d(x), random_times)
+
+
+@given(strategies.lists(strategies.tuples(random_tt2000_dtime, random_sub_ms, random_sub_ms), min_size=1, max_size=100))
+@example([(datetime(1972, 1, 1, 0, 0), 0, 0)])
+def test_compute_cdftt2000(dtimes):
+    random_times = [[t.year, t.month, t.day, t.hour, t.minute, t.second, t.microsecond // 1000, *sub_ms] for t, *sub_ms in dtimes]
+    x = cdfepoch.breakdown(cdfepoch.compute(random_times))
+    np.testing.assert_array_equal(np.atleast_2d(x), random_times)
 
 
 def test_parse_cdfepoch():
@@ -239,11 +188,12 @@ def test_findepochrange_cdfepoch():
     test_start = [2014, 8, 1, 8, 1, 54, 123]
     test_end = [2018, 1, 1, 1, 1, 1, 1]
     index = cdfepoch.findepochrange(time_array, starttime=test_start, endtime=test_end)
+    start, end = np.asarray(cdfepoch.compute([test_start, test_end]))
     # Test that the test_start is less than the first index, but more than one less
-    assert time_array[index[0]] >= cdfepoch.compute(test_start)
-    assert time_array[index[0] - 1] <= cdfepoch.compute(test_start)
+    assert time_array[index[0]] >= start
+    assert time_array[index[0] - 1] <= start
 
-    assert time_array[index[-1]] <= cdfepoch.compute(test_end)
+    assert time_array[index[-1]] <= end
 
 
 def test_findepochrange_cdftt2000():
@@ -255,12 +205,13 @@ def test_findepochrange_cdftt2000():
     test_start = [2004, 3, 1, 12, 25, 54, 123, 111, 98]
     test_end = [2004, 3, 1, 12, 26, 4, 123, 456, 789]
     index = cdfepoch.findepochrange(time_array, starttime=test_start, endtime=test_end)
+    start, end = np.asarray(cdfepoch.compute([test_start, test_end]))
     # Test that the test_start is less than the first index, but more than one less
-    assert time_array[index[0]] >= cdfepoch.compute(test_start)
-    assert time_array[index[0] - 1] <= cdfepoch.compute(test_start)
+    assert time_array[index[0]] >= start
+    assert time_array[index[0] - 1] <= start
 
-    assert time_array[index[-1]] <= cdfepoch.compute(test_end)
-    assert time_array[index[-1] + 1] >= cdfepoch.compute(test_end)
+    assert time_array[index[-1]] <= end
+    assert time_array[index[-1] + 1] >= end
 
 
 def test_findepochrange_cdfepoch16():
@@ -269,30 +220,32 @@ def test_findepochrange_cdfepoch16():
     x = cdfepoch.parse([start_time, end_time])
     first_int_step = int((x[1].real - x[0].real) / 1000)
     second_int_step = int((x[1].imag - x[0].imag) / 1000)
-    time_array = []
-    for i in range(0, 1000):
-        time_array.append(x[0] + complex(first_int_step * i, second_int_step * i))
+    i = np.arange(1000)
+    time_array = x[0] + first_int_step * i + 1j * (second_int_step * i)
 
     test_start = [1978, 6, 10, 3, 24, 22, 351, 793, 238, 462]
     test_end = [1978, 6, 12, 23, 11, 1, 338, 341, 416, 466]
     index = cdfepoch.findepochrange(time_array, starttime=test_start, endtime=test_end)
+    start, end = np.asarray(cdfepoch.compute([test_start, test_end])).real
 
     # Test that the test_start is less than the first index, but more than one less
-    assert time_array[index[0]].real >= cdfepoch.compute(test_start).real
-    assert time_array[index[0] - 1].real <= cdfepoch.compute(test_start).real
-    assert time_array[index[-1]].real <= cdfepoch.compute(test_end).real
-    assert time_array[index[-1] + 1].real >= cdfepoch.compute(test_end).real
+    assert time_array[index[0]].real >= start
+    assert time_array[index[0] - 1].real <= start
+    assert time_array[index[-1]].real <= end
+    assert time_array[index[-1] + 1].real >= end
 
 
+@pytest.mark.remote_data
 def test_latest_leapsecs():
     # Check that the built in leapseconds table is the latest one
-    local = epochs.LEAPSEC_FILE
+    local = Path(epochs.LEAPSEC_FILE).read_bytes()
     try:
-        remote, _ = urllib.request.urlretrieve("https://cdf.gsfc.nasa.gov/html/CDFLeapSeconds.txt")
+        with urllib.request.urlopen("https://cdf.gsfc.nasa.gov/html/CDFLeapSeconds.txt", timeout=10) as response:
+            remote = response.read()
     except Exception as excp:
         pytest.skip(f"problem downloading leapseconds file: {excp}")
-    if not filecmp.cmp(local, remote):
-        feedback = Path(remote).read_text(errors="ignore")
+    if remote != local:
+        feedback = remote.decode(errors="ignore")
         pytest.skip(f"problem downloading leapseconds file: \n\n{feedback}")
 
 
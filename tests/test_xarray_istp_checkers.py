@@ -1,4 +1,4 @@
-import os
+from types import MappingProxyType
 
 import numpy as np
 import pytest
@@ -7,130 +7,104 @@ import xarray as xr
 from cdflib.xarray import xarray_to_cdf
 from cdflib.xarray.xarray_to_cdf import ISTPError
 
-sample_global_attributes = {
-    "Project": "Hail Mary",
-    "Source_name": "Thin Air",
-    "Discipline": "None",
-    "Data_type": "counts",
-    "Descriptor": "Midichlorians in unicorn blood",
-    "Data_version": "3.14",
-    "Logical_file_id": "SEVENTEEN",
-    "PI_name": "Darth Vader",
-    "PI_affiliation": "Dark Side",
-    "TEXT": "AHHHHH",
-    "Instrument_type": "Banjo",
-    "Mission_group": "Impossible",
-    "Logical_source": ":)",
-    "Logical_source_description": ":(",
-}
-sample_variable_attributes = {
-    "CATDESC": "data",
-    "DISPLAY_TYPE": "spectrogram",
-    "FIELDNAM": "test",
-    "FORMAT": "test",
-    "UNITS": "test",
-    "VALIDMIN": 0,
-    "VALIDMAX": 10,
-    "FILLVAL": np.int64(-9223372036854775808),
-}
-sample_data_variable_attributes = sample_variable_attributes | {"VAR_TYPE": "data", "LABLAXIS": "test"}
-sample_support_variable_attributes = sample_variable_attributes | {"VAR_TYPE": "support_data"}
-
-
-def test_istp_dimension_attribute_checker():
+# The sample attributes are read-only, so no test can change them for another
+sample_global_attributes = MappingProxyType(
+    {
+        "Project": "Hail Mary",
+        "Source_name": "Thin Air",
+        "Discipline": "None",
+        "Data_type": "counts",
+        "Descriptor": "Midichlorians in unicorn blood",
+        "Data_version": "3.14",
+        "Logical_file_id": "SEVENTEEN",
+        "PI_name": "Darth Vader",
+        "PI_affiliation": "Dark Side",
+        "TEXT": "AHHHHH",
+        "Instrument_type": "Banjo",
+        "Mission_group": "Impossible",
+        "Logical_source": ":)",
+        "Logical_source_description": ":(",
+    }
+)
+sample_variable_attributes = MappingProxyType(
+    {
+        "CATDESC": "data",
+        "DISPLAY_TYPE": "spectrogram",
+        "FIELDNAM": "test",
+        "FORMAT": "test",
+        "UNITS": "test",
+        "VALIDMIN": 0,
+        "VALIDMAX": 10,
+        "FILLVAL": np.int64(-9223372036854775808),
+    }
+)
+sample_data_variable_attributes = MappingProxyType(sample_variable_attributes | {"VAR_TYPE": "data", "LABLAXIS": "test"})
+sample_support_variable_attributes = MappingProxyType(sample_variable_attributes | {"VAR_TYPE": "support_data"})
+#: Attributes of the data variable of the test datasets
+sample_depend_data_variable_attributes = MappingProxyType(
+    sample_data_variable_attributes | {"DEPEND_0": "epoch", "DEPEND_1": "direction"}
+)
+
+
+#: Values of the variables in the test datasets, shared between the datasets
+#: (xarray_to_cdf does not modify the data it writes)
+sample_data = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]], dtype=np.int64)
+sample_coordinate = np.array([1, 2, 3], dtype=np.int64)
+
+
+@pytest.fixture
+def make_istp_dataset():
+    """
+    Returns a function that builds a bare-minimum ISTP compliant dataset, with
+    a "data" variable that depends on "epoch" and "direction". Attributes in
+    ``data_attrs`` are added to (or replace those of) the data variable, and
+    if ``support_attrs`` is given a "support" variable with those extra
+    attributes is added along "direction".
+    """
+
+    def make(data_attrs=None, support_attrs=None):
+        data_vars = {
+            "data": xr.Variable(["epoch", "direction"], sample_data, sample_depend_data_variable_attributes | (data_attrs or {})),
+            "epoch": xr.Variable(["epoch"], sample_coordinate, sample_support_variable_attributes),
+            "direction": xr.Variable(["direction"], sample_coordinate, sample_support_variable_attributes),
+        }
+        if support_attrs is not None:
+            data_vars["support"] = xr.Variable(["direction"], sample_coordinate, sample_support_variable_attributes | support_attrs)
+        return xr.Dataset(data_vars=data_vars, attrs=sample_global_attributes)
+
+    return make
+
+
+def test_istp_dimension_attribute_checker(tmp_path, make_istp_dataset):
     # Create a bare-minimum ISTP compliant file
-    pytest.importorskip("xarray")
+    ds = make_istp_dataset()
 
-    var_data = [[1, 2, 3], [1, 2, 3], [1, 2, 3]]
-    var_dims = ["epoch", "direction"]
-    data = xr.Variable(var_dims, var_data, sample_data_variable_attributes | {"DEPEND_0": "epoch", "DEPEND_1": "direction"})
-    epoch_data = [1, 2, 3]
-    epoch_dims = ["epoch"]
-    epoch = xr.Variable(epoch_dims, epoch_data, sample_support_variable_attributes)
-    dir_data = [1, 2, 3]
-    dir_dims = ["direction"]
-    direction = xr.Variable(dir_dims, dir_data, sample_support_variable_attributes)
+    xarray_to_cdf(ds, tmp_path / "hello.cdf", auto_fix_depends=False, terminate_on_warning=True)
 
-    ds = xr.Dataset(data_vars={"data": data, "epoch": epoch, "direction": direction}, attrs=sample_global_attributes)
 
-    xarray_to_cdf(ds, "hello.cdf", auto_fix_depends=False, terminate_on_warning=True)
-    os.remove("hello.cdf")
-
-
-def test_istp_dimension_attribute_checker_with_typo():
+def test_istp_dimension_attribute_checker_with_typo(tmp_path, make_istp_dataset):
     # Put an extra "n" on the end of "DEPEND_1":"directionn" from the last test,
     # and make sure it fails
-    pytest.importorskip("xarray")
-
-    var_data = [[1, 2, 3], [1, 2, 3], [1, 2, 3]]
-    var_dims = ["epoch", "direction"]
-    data = xr.Variable(var_dims, var_data, sample_data_variable_attributes | {"DEPEND_0": "epoch", "DEPEND_1": "directionn"})
-    epoch_data = [1, 2, 3]
-    epoch_dims = ["epoch"]
-    epoch = xr.Variable(epoch_dims, epoch_data, sample_support_variable_attributes)
-    dir_data = [1, 2, 3]
-    dir_dims = ["direction"]
-    direction = xr.Variable(dir_dims, dir_data, sample_support_variable_attributes)
-
-    ds = xr.Dataset(data_vars={"data": data, "epoch": epoch, "direction": direction}, attrs=sample_global_attributes)
+    ds = make_istp_dataset(data_attrs={"DEPEND_1": "directionn"})
     with pytest.raises(ISTPError):
-        xarray_to_cdf(ds, "hello.cdf", auto_fix_depends=False, terminate_on_warning=True)
+        xarray_to_cdf(ds, tmp_path / "hello.cdf", auto_fix_depends=False, terminate_on_warning=True)
+    # The dataset is checked before the file is created
+    assert not (tmp_path / "hello.cdf").exists()
 
-    if os.path.exists("hello.cdf"):
-        os.remove("hello.cdf")
 
-
-def test_istp_support_data_has_depends():
+def test_istp_support_data_has_depends(tmp_path, make_istp_dataset):
     # We're going to test that a support_data variable is allowed to have its own DEPEND_{i}
-    pytest.importorskip("xarray")
-
-    var_data = [[1, 2, 3], [1, 2, 3], [1, 2, 3]]
-    var_dims = ["epoch", "direction"]
-    data = xr.Variable(var_dims, var_data, sample_data_variable_attributes | {"DEPEND_0": "epoch", "DEPEND_1": "direction"})
-    support_data = [1, 2, 3]
-    support_dims = ["direction"]
-    support = xr.Variable(support_dims, support_data, sample_support_variable_attributes | {"DEPEND_1": "direction"})
-    epoch_data = [1, 2, 3]
-    epoch_dims = ["epoch"]
-    epoch = xr.Variable(epoch_dims, epoch_data, sample_support_variable_attributes)
-    dir_data = [1, 2, 3]
-    dir_dims = ["direction"]
-    direction = xr.Variable(dir_dims, dir_data, sample_support_variable_attributes)
-
-    ds = xr.Dataset(
-        data_vars={"data": data, "epoch": epoch, "direction": direction, "support": support}, attrs=sample_global_attributes
-    )
-
-    xarray_to_cdf(ds, "hello.cdf", auto_fix_depends=False, terminate_on_warning=True)
-    os.remove("hello.cdf")
-
-
-def test_istp_support_data_has_depends_expected_failure():
+    ds = make_istp_dataset(support_attrs={"DEPEND_1": "direction"})
+
+    xarray_to_cdf(ds, tmp_path / "hello.cdf", auto_fix_depends=False, terminate_on_warning=True)
+
+
+def test_istp_support_data_has_depends_expected_failure(tmp_path, make_istp_dataset):
     # We're going to mimic the previous test, but give support a DEPEND_0 of "epoch".
     # This should make it fail, because it does not have enough dimensions
-    pytest.importorskip("xarray")
-
-    var_data = [[1, 2, 3], [1, 2, 3], [1, 2, 3]]
-    var_dims = ["epoch", "direction"]
-    data = xr.Variable(var_dims, var_data, sample_data_variable_attributes | {"DEPEND_0": "epoch", "DEPEND_1": "direction"})
-    support_data = [1, 2, 3]
-    support_dims = ["direction"]
-    support = xr.Variable(
-        support_dims, support_data, sample_support_variable_attributes | {"DEPEND_0": "epoch", "DEPEND_1": "direction"}
-    )
-    epoch_data = [1, 2, 3]
-    epoch_dims = ["epoch"]
-    epoch = xr.Variable(epoch_dims, epoch_data, sample_support_variable_attributes)
-    dir_data = [1, 2, 3]
-    dir_dims = ["direction"]
-    direction = xr.Variable(dir_dims, dir_data, sample_support_variable_attributes)
-
-    ds = xr.Dataset(
-        data_vars={"data": data, "epoch": epoch, "direction": direction, "support": support}, attrs=sample_global_attributes
-    )
+    ds = make_istp_dataset(support_attrs={"DEPEND_0": "epoch", "DEPEND_1": "direction"})
 
     with pytest.raises(ISTPError):
-        xarray_to_cdf(ds, "hello.cdf", auto_fix_depends=False, terminate_on_warning=True)
-
-    if os.path.exists("hello.cdf"):
-        os.remove("hello.cdf")
+        xarray_to_cdf(ds, tmp_path / "hello.cdf", auto_fix_depends=False, terminate_on_warning=True)
+    # The dataset is checked before the file is created
+    assert not (tmp_path / "hello.cdf").exists()